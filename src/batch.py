@@ -0,0 +1,166 @@
+"""Lockstep simulation of many independent games.
+
+``GameBatch`` holds N games in flat NumPy arrays and advances all of them
+with one vectorized ``step`` per frame, following the rules of
+``GameLogic.update_game_state``. Used for training and evaluating paddle
+bots. Requires numpy.
+"""
+from typing import Optional
+
+from src.entity_store import EntityArrays, _require_numpy, np
+from src.game_classes import (
+    BALL_COLORS,
+    BALL_RADIUS,
+    BOMB_RADIUS,
+    DEFAULT_DIFFICULTY,
+    HEIGHT,
+    PADDLE_WIDTH,
+    WIDTH,
+    Difficulty,
+)
+
+
+class BatchEntities(EntityArrays):
+    """``EntityArrays`` shared by many games; ``game`` is the owner index."""
+
+    _fields = EntityArrays._fields + ("game",)
+
+    def __init__(self, radius: int, palette=None, capacity: int = 256):
+        super().__init__(radius, palette, capacity)
+        self.game = np.zeros(capacity, dtype=np.int32)
+
+    def extend_for(self, game, x, y, speed, color=0) -> None:
+        super().extend(x, y, speed, color)
+        self.game[self.count - len(game) : self.count] = game
+
+    def step_games(self, paddle_x, paddle_y: int, active):
+        """Advance entities of active games; return the owners of caught ones."""
+        n = self.count
+        if n == 0:
+            return self.game[:0]
+        owner = self.game[:n]
+        moving = active[owner]
+        x = self.x[:n]
+        y = self.y[:n]
+        y += self.speed[:n] * moving
+        left = paddle_x[owner]
+        caught = moving & (y + self.radius >= paddle_y) & (x >= left)
+        caught &= x <= left + PADDLE_WIDTH
+        gone = caught | (moving & (y > HEIGHT))
+        caught_owner = owner[caught]
+        self._compact(gone)
+        return caught_owner
+
+
+class GameBatch:
+    """N independent games advanced together.
+
+    Per-game state (paddle, lives, score, timers, delays) lives in arrays
+    of length ``n``. ``step(actions)`` takes one action per game: negative
+    moves the paddle left, positive moves it right, zero keeps it still.
+    """
+
+    def __init__(
+        self,
+        n: int,
+        seed: Optional[int] = None,
+        paddle_speed: int = 8,
+        difficulty: Difficulty = DEFAULT_DIFFICULTY,
+    ):
+        _require_numpy()
+        self.n = n
+        self.difficulty = difficulty
+        self.rng = np.random.default_rng(seed)
+        self.paddle_speed = paddle_speed
+        self.paddle_y = HEIGHT - 40
+        self.balls = BatchEntities(BALL_RADIUS, BALL_COLORS)
+        self.bombs = BatchEntities(BOMB_RADIUS)
+        self.paddle_x = np.zeros(n, dtype=np.int32)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.lives = np.zeros(n, dtype=np.int32)
+        self.game_over = np.zeros(n, dtype=bool)
+        self.ball_spawn_timer = np.zeros(n, dtype=np.int32)
+        self.bomb_spawn_timer = np.zeros(n, dtype=np.int32)
+        self.ball_spawn_delay = np.zeros(n, dtype=np.int32)
+        self.bomb_spawn_delay = np.zeros(n, dtype=np.int32)
+        self.reset()
+
+    def reset(self, games=None) -> None:
+        """Restart the given games (all by default), like ``reset_game``."""
+        if games is None:
+            games = np.arange(self.n)
+        games = np.asarray(games, dtype=np.int32)
+        mask = np.zeros(self.n, dtype=bool)
+        mask[games] = True
+        for store in (self.balls, self.bombs):
+            store._compact(mask[store.game[: store.count]])
+        self.paddle_x[games] = WIDTH // 2 - PADDLE_WIDTH // 2
+        self.score[games] = 0
+        self.lives[games] = 3
+        self.game_over[games] = False
+        self.ball_spawn_timer[games] = 0
+        self.bomb_spawn_timer[games] = 0
+        self.ball_spawn_delay[games] = self.difficulty.ball_delay
+        self.bomb_spawn_delay[games] = self.difficulty.bomb_delay
+        self._spawn_balls(games)
+
+    def _spawn_balls(self, games) -> None:
+        k = len(games)
+        if not k:
+            return
+        x = self.rng.integers(BALL_RADIUS, WIDTH - BALL_RADIUS + 1, size=k)
+        speed = self.rng.integers(3, 8, size=k)
+        color = self.rng.integers(0, len(BALL_COLORS), size=k)
+        # Ball() starts at the top edge rather than above it
+        self.balls.extend_for(games, x, 0, speed, color)
+
+    def _spawn_bombs(self, games) -> None:
+        k = len(games)
+        if not k:
+            return
+        x = self.rng.integers(BOMB_RADIUS, WIDTH - BOMB_RADIUS + 1, size=k)
+        speed = self.rng.integers(2, 6, size=k)
+        self.bombs.extend_for(games, x, -BOMB_RADIUS, speed)
+
+    def step(self, actions=None) -> None:
+        active = ~self.game_over
+        if actions is not None:
+            direction = np.sign(np.asarray(actions, dtype=np.int32))
+            self.paddle_x += direction * self.paddle_speed
+            np.clip(self.paddle_x, 0, WIDTH - PADDLE_WIDTH, out=self.paddle_x)
+
+        caught = self.balls.step_games(self.paddle_x, self.paddle_y, active)
+        if len(caught):
+            self.score += np.bincount(caught, minlength=self.n)
+
+        hit = self.bombs.step_games(self.paddle_x, self.paddle_y, active)
+        if len(hit):
+            self.lives -= np.bincount(hit, minlength=self.n).astype(np.int32)
+            np.maximum(self.lives, 0, out=self.lives)
+            self.game_over |= self.lives <= 0
+
+        # Games that were still running at the start of the frame spawn,
+        # matching update_game_state which spawns after the game-over check
+        self.ball_spawn_timer += active
+        due = active & (self.ball_spawn_timer >= self.ball_spawn_delay)
+        if due.any():
+            self._spawn_balls(np.flatnonzero(due))
+            self.ball_spawn_timer[due] = 0
+            d = self.difficulty
+            steps = self.score[due] // d.ball_score_step
+            delay = d.ball_delay - steps * d.ball_delay_step
+            self.ball_spawn_delay[due] = np.maximum(d.ball_min_delay, delay)
+
+        self.bomb_spawn_timer += active
+        due = active & (self.bomb_spawn_timer >= self.bomb_spawn_delay)
+        if due.any():
+            self._spawn_bombs(np.flatnonzero(due))
+            self.bomb_spawn_timer[due] = 0
+            d = self.difficulty
+            steps = self.score[due] // d.bomb_score_step
+            delay = d.bomb_delay - steps * d.bomb_delay_step
+            self.bomb_spawn_delay[due] = np.maximum(d.bomb_min_delay, delay)
+
+    @property
+    def all_over(self) -> bool:
+        return bool(self.game_over.all())
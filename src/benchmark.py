@@ -0,0 +1,338 @@
+"""Benchmarks for the simulation, rendering and score storage hot paths.
+
+Each benchmark reports the best time per operation over a few repeats.
+Results can be saved as a baseline and later runs compared against it;
+anything slower than the baseline by more than the threshold is flagged
+and the run exits with status 1.
+
+Baselines depend on the machine, so they are kept out of version
+control. Example::
+
+    python -m src.benchmark --save      # record a baseline
+    python -m src.benchmark             # compare against it
+    python -m src.benchmark -k draw     # only benchmarks matching "draw"
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+# Allow running as a script as well as with -m
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from src.game_classes import HEIGHT, WIDTH, WHITE, Ball, Bomb, GameLogic
+from src.scores import ScoreBoard
+
+DEFAULT_BASELINE_FILE = os.path.join(
+    os.path.dirname(__file__), "..", "benchmark_baseline.json"
+)
+DEFAULT_THRESHOLD = 0.25
+ENTITY_COUNTS = (10, 100, 1000, 10000)
+SCORE_FILE_SIZES = (10, 100, 1000, 10000)
+IMPORTED_MODULES = ("src.game_classes", "src.main")
+ROOT = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+
+class Benchmark(NamedTuple):
+    name: str
+    # Returns a callable doing ``ops`` operations per call
+    setup: Callable[[], Callable[[], object]]
+    ops: int = 1
+    # The callable returns the seconds it measured itself
+    self_timed: bool = False
+
+
+class Result(NamedTuple):
+    name: str
+    seconds: float  # per operation
+    baseline: Optional[float] = None
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if not self.baseline:
+            return None
+        return self.seconds / self.baseline
+
+
+def measure(
+    run: Callable[[], object],
+    ops: int = 1,
+    repeat: int = 5,
+    min_time: float = 0.05,
+    self_timed: bool = False,
+) -> float:
+    """Best seconds per operation; each repeat loops for at least min_time."""
+    run()  # warm up caches and lazily built objects
+    if self_timed:
+        return min(run() for _ in range(repeat)) / ops  # type: ignore
+    best = float("inf")
+    for _ in range(repeat):
+        loops = 0
+        start = time.perf_counter()
+        while True:
+            run()
+            loops += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = min(best, elapsed / (loops * ops))
+    return best
+
+
+# Simulation
+
+def _crowded_game(count: int, top: int = 0) -> GameLogic:
+    game = GameLogic(save_scores=False, seed=1)
+    game.lives = 10 ** 9
+    # No spawning, so every call works on the same entities
+    game.ball_spawn_delay = game.bomb_spawn_delay = 10 ** 9
+    game.balls = [Ball(game.rng) for _ in range(count)]
+    game.bombs = [Bomb(game.rng) for _ in range(count)]
+    for i, entity in enumerate(game.balls + game.bombs):
+        entity.y = top + (i * 7) % HEIGHT
+    return game
+
+
+def _update(count: int):
+    def setup():
+        # Far enough above the screen that nothing lands while measuring,
+        # so every call moves the same number of entities
+        game = _crowded_game(count, top=-10 ** 7)
+        return game.update_game_state
+
+    return Benchmark(f"update/{count}", setup, 2 * count)
+
+
+def _update_crossing(count: int):
+    def setup():
+        # Entities spread over the screen, each falling until it is caught
+        # or leaves it, so the catch and cull paths are measured too
+        game = _crowded_game(count)
+        snapshot = game.snapshot()
+        frames = HEIGHT // 2 + 2  # the slowest bombs fall 2 pixels a tick
+
+        def run():
+            game.restore(snapshot)
+            for _ in range(frames):
+                game.update_game_state()
+
+        run.game = game  # type: ignore
+        return run
+
+    # Per entity, from its position to its removal
+    return Benchmark(f"update-crossing/{count}", setup, 2 * count)
+
+
+# Rendering
+
+def _surface():
+    # Rendering benchmarks draw on offscreen surfaces; no window is needed
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+
+    pygame.display.init()
+    return pygame.Surface((WIDTH, HEIGHT))
+
+
+def _draw(kind, count: int):
+    def setup():
+        screen = _surface()
+        game = _crowded_game(count)
+        entities = game.balls if kind is Ball else game.bombs
+
+        def run():
+            for entity in entities:
+                entity.draw(screen)
+
+        return run
+
+    return Benchmark(f"draw/{kind.__name__.lower()}", setup, count)
+
+
+def _blit_entities(count: int):
+    def setup():
+        from src.rendering import SpriteCache
+
+        screen = _surface()
+        game = _crowded_game(count)
+        sprites = SpriteCache()
+
+        def run():
+            sprites.blit_entities(screen, game.balls, game.bombs)
+
+        return run
+
+    return Benchmark("draw/sprites", setup, 2 * count)
+
+
+def _hud_text(cached: bool):
+    def setup():
+        import pygame
+
+        from src.rendering import TextCache
+
+        pygame.font.init()
+        font = pygame.font.Font(None, 36)
+        cache = TextCache()
+        if cached:
+            return lambda: cache.render(font, "Score: 1234", WHITE)
+        return lambda: font.render("Score: 1234", True, WHITE)
+
+    return Benchmark("hud/text-cached" if cached else "hud/text", setup)
+
+
+# Score storage
+
+def _scores(size: int, operation: str):
+    def setup():
+        directory = tempfile.TemporaryDirectory(prefix="ctb-bench-")
+        path = os.path.join(directory.name, "scores.json")
+        with open(path, "w") as f:
+            json.dump([{"name": f"P{i}", "score": i} for i in range(size)], f)
+        board = ScoreBoard(path, limit=size, check_interval=0, background=False)
+        board.load()
+
+        def run():
+            if operation == "save":
+                board.add("Bench", size // 2)
+            elif operation == "load":
+                board.load()
+            else:
+                board.invalidate()
+                board.load()
+
+        # Removed with the benchmark once it is no longer referenced
+        run.directory = directory  # type: ignore
+        return run
+
+    return Benchmark(f"scores/{operation}/{size}", setup)
+
+
+# Startup
+
+IMPORT_SCRIPT = """
+import sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+
+def import_time(module: str) -> float:
+    """Seconds to import ``module`` in a fresh interpreter."""
+    script = IMPORT_SCRIPT.format(root=ROOT, module=module)
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout
+    return float(output.split()[-1])
+
+
+def _import(module: str):
+    def setup():
+        # Timed inside the child, so interpreter start-up is not counted
+        return lambda: import_time(module)
+
+    return Benchmark(f"import/{module}", setup, self_timed=True)
+
+
+def default_benchmarks() -> List[Benchmark]:
+    benchmarks = [_import(module) for module in IMPORTED_MODULES]
+    benchmarks += [_update(count) for count in ENTITY_COUNTS]
+    benchmarks += [_update_crossing(count) for count in ENTITY_COUNTS[:3]]
+    benchmarks += [_draw(Ball, 1000), _draw(Bomb, 1000), _blit_entities(1000)]
+    benchmarks += [_hud_text(False), _hud_text(True)]
+    for size in SCORE_FILE_SIZES:
+        for operation in ("save", "load", "load-cold"):
+            benchmarks.append(_scores(size, operation))
+    return benchmarks
+
+
+def load_baseline(path: str) -> Dict[str, float]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def save_baseline(path: str, results: Sequence[Result]) -> None:
+    baseline = load_baseline(path)
+    baseline.update({result.name: result.seconds for result in results})
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=4, sort_keys=True)
+
+
+def run(
+    benchmarks: Sequence[Benchmark],
+    baseline: Optional[Dict[str, float]] = None,
+    repeat: int = 5,
+    min_time: float = 0.05,
+) -> List[Result]:
+    baseline = baseline or {}
+    results = []
+    for benchmark in benchmarks:
+        seconds = measure(
+            benchmark.setup(), benchmark.ops, repeat, min_time, benchmark.self_timed
+        )
+        results.append(Result(benchmark.name, seconds, baseline.get(benchmark.name)))
+    return results
+
+
+def regressions(results: Sequence[Result], threshold: float) -> List[Result]:
+    """Results slower than their baseline by more than ``threshold``."""
+    return [r for r in results if r.ratio is not None and r.ratio > 1 + threshold]
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.1f} ns"
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="pattern", default="", help="only run matching names")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_FILE)
+    parser.add_argument(
+        "--save", action="store_true", help="store these results as the baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="flag results this fraction slower than the baseline",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    benchmarks = [b for b in default_benchmarks() if args.pattern in b.name]
+    results = run(benchmarks, load_baseline(args.baseline), repeat=args.repeat)
+    slow = regressions(results, args.threshold)
+    for result in results:
+        line = f"{result.name:<24} {_format_time(result.seconds)}/op"
+        if result.ratio is not None:
+            line += f"  {result.ratio:5.2f}x baseline"
+            if result in slow:
+                line += "  REGRESSION"
+        print(line)
+
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f"baseline saved to {args.baseline}")
+        return 0
+    if slow:
+        print(f"{len(slow)} benchmark(s) slower than baseline by over {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
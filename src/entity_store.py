@@ -0,0 +1,245 @@
+"""Array-backed entity storage for stress modes.
+
+Balls and bombs are kept as contiguous NumPy arrays (struct of arrays), so
+movement, catch tests and off-screen culling are a handful of vectorized
+operations per frame instead of one Python call per object. NumPy is an
+optional dependency; the regular ``GameLogic`` does not need it.
+"""
+from typing import Iterator, NamedTuple, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+from src.game_classes import (
+    BALL_COLORS,
+    BALL_RADIUS,
+    BOMB_RADIUS,
+    DEFAULT_DIFFICULTY,
+    HEIGHT,
+    PADDLE_WIDTH,
+    YELLOW,
+    Difficulty,
+    GameLogic,
+)
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("The array entity store requires numpy (pip install numpy)")
+
+
+class EntityView(NamedTuple):
+    x: int
+    y: int
+    speed: int
+    color: Tuple[int, int, int]
+
+
+class EntityArrays:
+    """Falling objects of one kind stored as parallel arrays.
+
+    Only the first ``len(self)`` slots are live. ``color`` holds an index
+    into ``palette``.
+    """
+
+    _fields = ("x", "y", "speed", "color")
+
+    def __init__(self, radius: int, palette=None, capacity: int = 64):
+        _require_numpy()
+        self.radius = radius
+        self.palette = list(palette or [YELLOW])
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.int32)
+        self.speed = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros(capacity, dtype=np.uint8)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[EntityView]:
+        # Convenience for drawing and bots; the hot path never iterates
+        for i in range(self.count):
+            yield EntityView(
+                int(self.x[i]),
+                int(self.y[i]),
+                int(self.speed[i]),
+                self.palette[self.color[i]],
+            )
+
+    def _grow(self, needed: int) -> None:
+        capacity = len(self.x)
+        while capacity < needed:
+            capacity *= 2
+        for name in self._fields:
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: self.count] = old[: self.count]
+            setattr(self, name, new)
+
+    def append(self, x: int, y: int, speed: int, color: int = 0) -> None:
+        if self.count == len(self.x):
+            self._grow(self.count + 1)
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.speed[i] = speed
+        self.color[i] = color
+        self.count += 1
+
+    def extend(self, x, y, speed, color=0) -> None:
+        x = np.asarray(x, dtype=np.int32)
+        n = len(x)
+        if self.count + n > len(self.x):
+            self._grow(self.count + n)
+        end = self.count + n
+        self.x[self.count : end] = x
+        self.y[self.count : end] = y
+        self.speed[self.count : end] = speed
+        self.color[self.count : end] = color
+        self.count = end
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def copy_live(self):
+        """Copies of the live part of every field."""
+        return tuple(getattr(self, name)[: self.count].copy() for name in self._fields)
+
+    def set_live(self, fields) -> None:
+        """Replace the live entities with arrays from ``copy_live``."""
+        n = len(fields[0])
+        if n > len(self.x):
+            self._grow(n)
+        for name, values in zip(self._fields, fields):
+            getattr(self, name)[:n] = values
+        self.count = n
+
+    def step(self, paddle_x: int, paddle_y: int) -> Tuple[int, int]:
+        """Move every entity one frame and drop caught and missed ones.
+
+        Same rules as ``Ball.is_caught``/``is_off_screen``; returns
+        ``(caught, missed)`` counts.
+        """
+        n = self.count
+        if n == 0:
+            return 0, 0
+        x = self.x[:n]
+        y = self.y[:n]
+        y += self.speed[:n]
+        caught = (y + self.radius >= paddle_y) & (x >= paddle_x)
+        caught &= x <= paddle_x + PADDLE_WIDTH
+        gone = caught | (y > HEIGHT)
+        removed = self._compact(gone)
+        n_caught = int(np.count_nonzero(caught))
+        return n_caught, removed - n_caught
+
+    def _compact(self, gone) -> int:
+        # Drop the live slots flagged in ``gone``, preserving order
+        removed = int(np.count_nonzero(gone))
+        if removed:
+            n = self.count
+            keep = ~gone
+            kept = n - removed
+            for name in self._fields:
+                arr = getattr(self, name)
+                arr[:kept] = arr[:n][keep]
+            self.count = kept
+        return removed
+
+
+class ArrayGameLogic(GameLogic):
+    """``GameLogic`` with balls and bombs held in ``EntityArrays``.
+
+    Follows the same rules as ``GameLogic.update_game_state``.
+    ``spawn_batch`` spawns that many objects per spawn tick, which is how
+    stress modes reach tens of thousands of objects on screen.
+    """
+
+    def __init__(
+        self,
+        player_name: str = "Player",
+        save_scores: bool = True,
+        seed: Optional[int] = None,
+        spawn_batch: int = 1,
+        difficulty: Difficulty = DEFAULT_DIFFICULTY,
+    ):
+        self.spawn_batch = spawn_batch
+        super().__init__(player_name, save_scores, seed, difficulty)
+
+    def _reset_entities(self):
+        self.balls = EntityArrays(BALL_RADIUS, BALL_COLORS)
+        self.bombs = EntityArrays(BOMB_RADIUS)
+        self._spawn_balls(1)
+
+    def _spawn_balls(self, count: int) -> None:
+        params = [self.rng.next_ball() for _ in range(count)]
+        xs, speeds, colors = zip(*params)
+        colors = [BALL_COLORS.index(color) for color in colors]
+        # Ball() starts at the top edge rather than above it
+        self.balls.extend(xs, 0, speeds, colors)
+
+    def _spawn_bombs(self, count: int) -> None:
+        xs, speeds = zip(*[self.rng.next_bomb() for _ in range(count)])
+        self.bombs.extend(xs, -BOMB_RADIUS, speeds)
+
+    def update_game_state(self):
+        if self.game_over:
+            return
+
+        caught, _ = self.balls.step(self.paddle_x, self.paddle_y)
+        self.score += caught
+
+        hits, _ = self.bombs.step(self.paddle_x, self.paddle_y)
+        if hits:
+            self.lives = max(0, self.lives - hits)
+            if self.lives <= 0:
+                self.game_over = True
+                self.save_score()
+
+        self.ball_spawn_timer += 1
+        if self.ball_spawn_timer >= self.ball_spawn_delay:
+            self._spawn_balls(self.spawn_batch)
+            self.ball_spawn_timer = 0
+            self.ball_spawn_delay = self.difficulty.ball_spawn_delay(self.score)
+
+        self.bomb_spawn_timer += 1
+        if self.bomb_spawn_timer >= self.bomb_spawn_delay:
+            self._spawn_bombs(self.spawn_batch)
+            self.bomb_spawn_timer = 0
+            self.bomb_spawn_delay = self.difficulty.bomb_spawn_delay(self.score)
+
+    def _snapshot_entities(self):
+        return self.balls.copy_live(), self.bombs.copy_live()
+
+    def _restore_entities(self, entities):
+        balls, bombs = entities
+        self.balls.set_live(balls)
+        self.bombs.set_live(bombs)
+
+    def _frames_to_entity_event(self):
+        frames = float("inf")
+        left = self.paddle_x
+        for store in (self.balls, self.bombs):
+            n = store.count
+            if not n:
+                continue
+            x = store.x[:n]
+            y = store.y[:n]
+            speed = store.speed[:n]
+            over = (x >= left) & (x <= left + PADDLE_WIDTH)
+            # Same closed forms as frames_until_event, vectorized
+            catch = -((y + store.radius - self.paddle_y) // speed)
+            miss = (HEIGHT - y) // speed + 1
+            k = np.maximum(1, np.where(over, catch, miss))
+            frames = min(frames, int(k.min()))
+        return frames
+
+    def _skip_frames(self, frames):
+        for store in (self.balls, self.bombs):
+            n = store.count
+            store.y[:n] += store.speed[:n] * frames
+        self.ball_spawn_timer += frames
+        self.bomb_spawn_timer += frames
@@ -0,0 +1,209 @@
+"""SQLite leaderboard keeping every game result.
+
+An alternative to the JSON ``ScoreBoard`` for cabinets that play far more
+games than a top-10 file can represent. Every result is stored; indexes
+keep top-N, per-player best and rank queries fast with millions of rows.
+The database runs in WAL mode so readers never block the writer.
+
+It offers the same ``load``/``add``/``flush`` interface as ``ScoreBoard``
+and can be plugged into the game with ``GameLogic.score_store``.
+"""
+import json
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+
+from src.scores import Entry, ScoreWriter, top_scores, track_store
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    played_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_score ON results (score DESC);
+CREATE INDEX IF NOT EXISTS results_name_score ON results (name, score DESC);
+
+-- Results per score and per block of 1024 scores, kept by triggers, so a
+-- rank sums a few counts instead of scanning every better result
+CREATE TABLE IF NOT EXISTS score_counts (
+    score INTEGER PRIMARY KEY,
+    n INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS score_buckets (
+    bucket INTEGER PRIMARY KEY,
+    n INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS results_count_insert AFTER INSERT ON results
+BEGIN
+    INSERT INTO score_counts (score, n) VALUES (NEW.score, 1)
+        ON CONFLICT (score) DO UPDATE SET n = n + 1;
+    INSERT INTO score_buckets (bucket, n) VALUES (NEW.score >> 10, 1)
+        ON CONFLICT (bucket) DO UPDATE SET n = n + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS results_count_delete AFTER DELETE ON results
+BEGIN
+    UPDATE score_counts SET n = n - 1 WHERE score = OLD.score;
+    UPDATE score_buckets SET n = n - 1 WHERE bucket = OLD.score >> 10;
+END;
+"""
+
+# Databases created before the count tables existed
+BACKFILL = (
+    "INSERT INTO score_counts (score, n)"
+    " SELECT score, COUNT(*) FROM results GROUP BY score",
+    "INSERT INTO score_buckets (bucket, n)"
+    " SELECT score >> 10, COUNT(*) FROM results GROUP BY score >> 10",
+)
+
+RANK = """
+SELECT
+    (SELECT COALESCE(SUM(n), 0) FROM score_buckets WHERE bucket > ?1 >> 10)
+    + (SELECT COALESCE(SUM(n), 0) FROM score_counts
+       WHERE score > ?1 AND score < ((?1 >> 10) + 1) << 10)
+"""
+
+
+def connect(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    # WAL with synchronous=NORMAL stays consistent and skips most fsyncs
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    # Immediate, so two processes opening an old database count it once
+    conn.execute("BEGIN IMMEDIATE")
+    with conn:
+        counted = conn.execute("SELECT 1 FROM score_counts LIMIT 1").fetchone()
+        if not counted and conn.execute("SELECT 1 FROM results LIMIT 1").fetchone():
+            for statement in BACKFILL:
+                conn.execute(statement)
+    return conn
+
+
+class SQLiteLeaderboard:
+    def __init__(
+        self,
+        path: str,
+        limit: int = 10,
+        check_interval: float = 0.5,
+        background: bool = True,
+    ):
+        self.path = path
+        self.limit = limit
+        self.check_interval = check_interval
+        self._conn = connect(path)
+        self._write_conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._pending: List[tuple] = []
+        self._top: List[Entry] = []
+        self._version: Optional[int] = None
+        self._checked_at = float("-inf")
+        self._writer = ScoreWriter(self._write_pending) if background else None
+        track_store(self)
+
+    # Queries
+
+    def top(self, n: int = 10) -> List[Entry]:
+        rows = self._conn.execute(
+            "SELECT name, score FROM results ORDER BY score DESC, id LIMIT ?", (n,)
+        ).fetchall()
+        return [{"name": name, "score": score} for name, score in rows]
+
+    def best_for(self, name: str) -> Optional[int]:
+        row = self._conn.execute(
+            "SELECT MAX(score) FROM results WHERE name = ?", (name,)
+        ).fetchone()
+        return row[0]
+
+    def rank_of(self, score: int) -> int:
+        """1-based position a result with ``score`` takes on the board."""
+        return self._conn.execute(RANK, (score,)).fetchone()[0] + 1
+
+    def count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    # ScoreBoard interface
+
+    def load(self) -> List[Entry]:
+        """Return the top ``limit`` results, best first."""
+        try:
+            with self._lock:
+                now = time.monotonic()
+                if now - self._checked_at >= self.check_interval:
+                    self._checked_at = now
+                    # data_version changes whenever another connection commits
+                    version = self._conn.execute("PRAGMA data_version").fetchone()
+                    if version[0] != self._version:
+                        self._version = version[0]
+                        pending = [
+                            {"name": name, "score": score}
+                            for name, score, _ in self._pending
+                        ]
+                        best = self.top(self.limit) + pending
+                        self._top = top_scores(best, self.limit)
+                return list(self._top)
+        except Exception as e:
+            print(f"Error loading scores: {e}")  # For debugging
+            return []
+
+    def add(self, name: str, score: int) -> None:
+        with self._lock:
+            self._pending.append((name, score, time.time()))
+            entry = {"name": name, "score": score}
+            self._top = top_scores(self._top + [entry], self.limit)
+        if self._writer is not None:
+            self._writer.request()
+        else:
+            self._write_pending()
+
+    def _write_pending(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
+        try:
+            # Connections are tied to the thread that opened them
+            if self._write_conn is None:
+                background = self._writer is not None
+                self._write_conn = connect(self.path) if background else self._conn
+            with self._write_conn:
+                self._write_conn.executemany(
+                    "INSERT INTO results (name, score, played_at) VALUES (?, ?, ?)",
+                    pending,
+                )
+        except Exception as e:
+            print(f"Error saving score: {e}")  # For debugging
+            with self._lock:
+                # Keep them queued for the next write or flush()
+                self._pending = pending + self._pending
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued results to be stored; False if they were not."""
+        with self._lock:
+            retry = bool(self._pending)
+        # Results left over from a failed write get another attempt
+        if self._writer is None:
+            if retry:
+                self._write_pending()
+        elif retry:
+            self._writer.request()
+        if self._writer is not None and not self._writer.flush(timeout):
+            return False
+        with self._lock:
+            return not self._pending
+
+    def import_json(self, path: str) -> int:
+        """Copy the entries of a JSON scores file; return how many."""
+        with open(path, "r") as f:
+            entries = json.load(f)
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO results (name, score, played_at) VALUES (?, ?, ?)",
+                [(e["name"], e["score"], now) for e in entries],
+            )
+        self._version = None
+        self._checked_at = float("-inf")
+        return len(entries)
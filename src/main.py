@@ -1,127 +1,325 @@
+import argparse
 import os
 import sys
 # Add the project root directory to Python path
 sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+if __name__ == "__main__":
+    # Keep pygame's banner out of the console when running the game; set
+    # only here, so importers' environments are left alone
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
 
 import pygame
-from src.game_classes import Ball, Bomb, GameLogic, WIDTH, HEIGHT, WHITE, BLACK, RED, PADDLE_WIDTH, PADDLE_HEIGHT
+from src.game_classes import GameLogic, WIDTH, HEIGHT, WHITE, BLACK, RED
+from src.scores import flush_all
+from src.profiler import DRAW, EVENTS, FLIP, TICK, UPDATE, FrameProfiler
+from src.rendering import (
+    DirtyRectRenderer, ProfilerOverlay, SpriteCache, TextCache, draw_game
+)
+from src.timestep import TICK_RATE, FixedTimestep
 
-# Initialize pygame
-pygame.init()
-
-# Set up the display
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Catch the Ball")
-clock = pygame.time.Clock()
+# Redraw rate cap; the simulation always runs at TICK_RATE
 FPS = 60
+# How long menu screens sleep waiting for input before checking for
+# changes, in milliseconds
+IDLE_TIMEOUT_MS = 500
+UNFOCUSED_TIMEOUT_MS = 5000
+
+# Set up by init_display() on first use, so importing this module does
+# not open a window
+screen = None
+clock = None
+font = None
+big_font = None
+text_cache = TextCache()
+sprites = SpriteCache()
+
+def init_display():
+    """Open the window and load fonts, once.
+
+    Only the display and font subsystems are started; pygame.init() would
+    also bring up audio and joysticks, which the game never uses.
+    """
+    global screen, clock, font, big_font
+    if screen is not None:
+        return
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Catch the Ball")
+    clock = pygame.time.Clock()
+    font = pygame.font.Font(None, 36)
+    big_font = pygame.font.Font(None, 72)
 
-# Initialize fonts
-font = pygame.font.Font(None, 36)
-big_font = pygame.font.Font(None, 72)
+def wait_for_events(focused):
+    """Block until input arrives, or the idle timeout passes.
+
+    Returns the waiting events, or an empty list on timeout. Without
+    focus the timeout is much longer, so an idle cabinet barely wakes up.
+    """
+    timeout = IDLE_TIMEOUT_MS if focused else UNFOCUSED_TIMEOUT_MS
+    event = pygame.event.wait(timeout)
+    if event.type == pygame.NOEVENT:
+        return []
+    return [event] + pygame.event.get()
+
+def focus_change(event):
+    """True or False when ``event`` gains or loses window focus, else None."""
+    if event.type == pygame.WINDOWFOCUSGAINED:
+        return True
+    if event.type == pygame.WINDOWFOCUSLOST:
+        return False
+    return None
 
 def get_player_name():
+    init_display()
     name = ""
-    input_active = True
+    focused = True
+    redraw = True
     
-    while input_active:
-        screen.fill(BLACK)
-        for event in pygame.event.get():
+    while True:
+        # Static screen: draw only after something changed
+        if redraw:
+            screen.fill(BLACK)
+            prompt_text = text_cache.render(font, "Enter your name:", WHITE)
+            name_text = text_cache.render(font, name, WHITE)
+            instruction_text = text_cache.render(font, "Press ENTER when done", WHITE)
+            
+            screen.blit(prompt_text, (WIDTH//2 - prompt_text.get_width()//2, HEIGHT//2 - 60))
+            screen.blit(name_text, (WIDTH//2 - name_text.get_width()//2, HEIGHT//2))
+            screen.blit(instruction_text, (WIDTH//2 - instruction_text.get_width()//2, HEIGHT//2 + 60))
+            
+            pygame.display.flip()
+            redraw = False
+        
+        for event in wait_for_events(focused):
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             if event.type == pygame.KEYDOWN:
+                redraw = True
                 if event.key == pygame.K_RETURN and name.strip():
-                    input_active = False
+                    return name.strip()
                 elif event.key == pygame.K_BACKSPACE:
                     name = name[:-1]
                 else:
                     if len(name) < 15:  # Limit name length
                         name += event.unicode
-        
-        prompt_text = font.render("Enter your name:", True, WHITE)
-        name_text = font.render(name, True, WHITE)
-        instruction_text = font.render("Press ENTER when done", True, WHITE)
-        
-        screen.blit(prompt_text, (WIDTH//2 - prompt_text.get_width()//2, HEIGHT//2 - 60))
-        screen.blit(name_text, (WIDTH//2 - name_text.get_width()//2, HEIGHT//2))
-        screen.blit(instruction_text, (WIDTH//2 - instruction_text.get_width()//2, HEIGHT//2 + 60))
-        
-        pygame.display.flip()
-        clock.tick(FPS)
-    
-    return name.strip() or "Player"
+            elif event.type == pygame.WINDOWEXPOSED:
+                redraw = True
+            focus = focus_change(event)
+            if focus is not None:
+                focused = focus
+                redraw = redraw or focus
 
-def show_scoreboard():
-    scores = GameLogic.load_scores()
+def show_scoreboard(scores=None):
+    if scores is None:
+        scores = GameLogic.load_scores()
     y_offset = HEIGHT//2 + 20
     
     for i, score in enumerate(scores[:5]):  # Show top 5 scores
-        score_text = font.render(f"{i+1}. {score['name']}: {score['score']}", True, WHITE)
+        entry = f"{i+1}. {score['name']}: {score['score']}"
+        score_text = text_cache.render(font, entry, WHITE)
         screen.blit(score_text, (WIDTH//2 - score_text.get_width()//2, y_offset))
         y_offset += 40
 
-def main():
+def show_game_over(game):
+    """Show the game over screen; True to restart, False to quit.
+
+    Redraws only when it is uncovered, regains focus or the high scores
+    change, e.g. once another instance or the background writer saved.
+    """
+    focused = True
+    shown_scores = None
+    redraw = True
+    
+    while True:
+        scores = GameLogic.load_scores()
+        if scores != shown_scores:
+            shown_scores = scores
+            redraw = True
+        if redraw:
+            screen.fill(BLACK)
+            game_over_text = text_cache.render(big_font, "GAME OVER", RED)
+            score_text = text_cache.render(font, f"Final Score: {game.score}", WHITE)
+            restart_text = text_cache.render(font, "Press SPACE to restart", WHITE)
+            highscores_text = text_cache.render(font, "High Scores:", WHITE)
+            
+            screen.blit(game_over_text, (WIDTH//2 - game_over_text.get_width()//2, HEIGHT//2 - 150))
+            screen.blit(score_text, (WIDTH//2 - score_text.get_width()//2, HEIGHT//2 - 80))
+            screen.blit(highscores_text, (WIDTH//2 - highscores_text.get_width()//2, HEIGHT//2 - 20))
+            show_scoreboard(scores)
+            screen.blit(restart_text, (WIDTH//2 - restart_text.get_width()//2, HEIGHT - 100))
+            
+            pygame.display.flip()
+            redraw = False
+        
+        for event in wait_for_events(focused):
+            if event.type == pygame.QUIT:
+                return False
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                return True
+            if event.type == pygame.WINDOWEXPOSED:
+                redraw = True
+            focus = focus_change(event)
+            if focus is not None:
+                focused = focus
+                redraw = redraw or focus
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Catch the Ball")
+    parser.add_argument(
+        "--dirty-rects",
+        action="store_true",
+        help="only push changed screen regions (faster on software renderers)",
+    )
+    parser.add_argument(
+        "--leaderboard",
+        metavar="DB",
+        help="record every game in this SQLite database instead of scores.json",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="FILE",
+        help="save a replay of the session to FILE on exit",
+    )
+    parser.add_argument(
+        "--fps",
+        type=int,
+        default=FPS,
+        help=f"redraw rate cap, 0 for none; gameplay runs at {TICK_RATE} Hz regardless",
+    )
+    parser.add_argument(
+        "--profile-overlay",
+        action="store_true",
+        help="show frame-time percentiles on screen",
+    )
+    parser.add_argument(
+        "--profile-dump",
+        metavar="FILE",
+        help="write per-frame phase timings to FILE (.csv or .jsonl) on exit",
+    )
+    return parser.parse_args(argv)
+
+def main(
+    dirty_rects=False,
+    leaderboard=None,
+    record=None,
+    fps=None,
+    profile_overlay=False,
+    profile_dump=None,
+):
+    if fps is None:
+        fps = FPS
+    init_display()
+    if leaderboard:
+        from src.leaderboard import SQLiteLeaderboard
+        GameLogic.score_store = SQLiteLeaderboard(leaderboard)
     player_name = get_player_name()
     game = GameLogic(player_name)
+    recorder = None
+    if record:
+        from src.replay import Recorder
+        recorder = Recorder(game)
+    renderer = DirtyRectRenderer(screen, sprites) if dirty_rects else None
+    timestep = FixedTimestep(TICK_RATE)
+    # Paddle position before the last tick, for interpolation
+    previous_paddle_x = game.paddle_x
+    # Cheap enough to always run; only reported when asked for
+    profiler = FrameProfiler(budget=1 / (fps or TICK_RATE))
+    overlay = ProfilerOverlay(profiler, font) if profile_overlay else None
     
     running = True
     while running:
+        if game.game_over:
+            # Nothing moves on the game over screen; it waits for input
+            if not show_game_over(game):
+                break
+            game.reset_game()
+            if recorder is not None:
+                recorder.restart()
+            # Don't catch up on the time spent on the game over screen
+            timestep.reset()
+            previous_paddle_x = game.paddle_x
+            if renderer is not None:
+                renderer.invalidate()
+        
+        profiler.begin_frame()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 if not game.game_over:  # Save score if game isn't over when quitting
                     game.game_over = True
                     game.save_score()
                 running = False
-            if event.type == pygame.KEYDOWN:
-                if game.game_over and event.key == pygame.K_SPACE:
-                    game.reset_game()
+        profiler.mark(EVENTS)
+        if not running:
+            profiler.end_frame()
+            break
         
+        # Run as many fixed ticks as the elapsed time calls for, so
+        # gameplay speed does not depend on how fast frames are drawn
+        ticks = timestep.ticks()
+        if ticks:
+            keys = pygame.key.get_pressed()
+            left = keys[pygame.K_LEFT]
+            right = keys[pygame.K_RIGHT]
+        for _ in range(ticks):
+            if game.game_over:
+                break
+            if recorder is not None:
+                recorder.record(left, right)
+            previous_paddle_x = game.paddle_x
+            if left:
+                game.move_paddle_left()
+            if right:
+                game.move_paddle_right()
+            game.update_game_state()
+        profiler.mark(UPDATE)
         if game.game_over:
-            screen.fill(BLACK)
-            game_over_text = big_font.render("GAME OVER", True, RED)
-            score_text = font.render(f"Final Score: {game.score}", True, WHITE)
-            restart_text = font.render("Press SPACE to restart", True, WHITE)
-            highscores_text = font.render("High Scores:", True, WHITE)
-            
-            screen.blit(game_over_text, (WIDTH//2 - game_over_text.get_width()//2, HEIGHT//2 - 150))
-            screen.blit(score_text, (WIDTH//2 - score_text.get_width()//2, HEIGHT//2 - 80))
-            screen.blit(highscores_text, (WIDTH//2 - highscores_text.get_width()//2, HEIGHT//2 - 20))
-            show_scoreboard()
-            screen.blit(restart_text, (WIDTH//2 - restart_text.get_width()//2, HEIGHT - 100))
-            
-            pygame.display.flip()
-            clock.tick(FPS)
+            profiler.end_frame()
             continue
+
+        # Draw between the last two ticks
+        alpha = timestep.alpha
+        lag = 1.0 - alpha
+        moved = game.paddle_x - previous_paddle_x
+        paddle_x = round(previous_paddle_x + moved * alpha)
         
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT]:
-            game.move_paddle_left()
-        if keys[pygame.K_RIGHT]:
-            game.move_paddle_right()
-        
-        game.update_game_state()
-        
-        screen.fill(BLACK)
-        
-        pygame.draw.rect(screen, WHITE, (game.paddle_x, game.paddle_y, PADDLE_WIDTH, PADDLE_HEIGHT))
-        
-        for ball in game.balls:
-            ball.draw(screen)
-        for bomb in game.bombs:
-            bomb.draw(screen)
-        
-        score_text = font.render(f"Score: {game.score}", True, WHITE)
-        lives_text = font.render(f"Lives: {game.lives}", True, RED)
-        player_text = font.render(f"Player: {game.player_name}", True, WHITE)
-        screen.blit(score_text, (10, 10))
-        screen.blit(lives_text, (WIDTH - 120, 10))
-        screen.blit(player_text, (WIDTH//2 - player_text.get_width()//2, 10))
+        score_text = text_cache.render(font, f"Score: {game.score}", WHITE)
+        lives_text = text_cache.render(font, f"Lives: {game.lives}", RED)
+        player_text = text_cache.render(font, f"Player: {game.player_name}", WHITE)
+        hud = [
+            (score_text, (10, 10)),
+            (lives_text, (WIDTH - 120, 10)),
+            (player_text, (WIDTH//2 - player_text.get_width()//2, 10)),
+        ]
+        if overlay is not None:
+            hud.extend(overlay.surfaces())
         
-        pygame.display.flip()
-        clock.tick(FPS)
+        if renderer is not None:
+            dirty = renderer.draw_frame(game, hud, lag, paddle_x)
+            profiler.mark(DRAW)
+            renderer.present(dirty)
+        else:
+            screen.fill(BLACK)
+            draw_game(screen, game, sprites, lag, paddle_x)
+            for surface, position in hud:
+                screen.blit(surface, position)
+            profiler.mark(DRAW)
+            pygame.display.flip()
+        profiler.mark(FLIP)
+        clock.tick(fps)
+        profiler.mark(TICK)
+        profiler.end_frame()
     
+    if recorder is not None:
+        recorder.finish().save(record)
+    if profile_dump:
+        profiler.dump(profile_dump)
+        print("\n".join(profiler.format_summary()))
+    # Make sure the final score reaches the disk before exiting
+    flush_all()
     pygame.quit()
     sys.exit()
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main(**vars(parse_args()))
\ No newline at end of file
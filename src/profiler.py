@@ -0,0 +1,125 @@
+"""Per-phase frame timing for the game loop.
+
+``FrameProfiler`` records how long each phase of a frame took (event
+polling, simulation, drawing, display flip, clock wait) into a fixed-size
+ring buffer of floats. A frame costs a handful of ``perf_counter`` calls
+and array stores, so the profiler can stay on in production; summaries
+are only computed when asked for.
+
+Typical use::
+
+    profiler.begin_frame()
+    poll_events()
+    profiler.mark(EVENTS)
+    ...
+    profiler.end_frame()
+"""
+import csv
+import json
+import time
+from array import array
+from typing import Callable, Dict, List, Optional
+
+PHASES = ("events", "update", "draw", "flip", "tick")
+EVENTS, UPDATE, DRAW, FLIP, TICK = range(len(PHASES))
+
+# A frame counts as dropped when it takes this many times the budget
+DROP_FACTOR = 1.5
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    # Nearest rank on already sorted values
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class FrameProfiler:
+    def __init__(
+        self,
+        capacity: int = 3600,
+        budget: float = 1 / 60,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.capacity = capacity
+        self.budget = budget
+        self._clock = clock
+        # One row per frame: time per phase, then the whole frame
+        self._width = len(PHASES) + 1
+        self._samples = array("d", bytes(8 * capacity * self._width))
+        self._row = 0
+        self._start = self._mark = 0.0
+        self.frames = 0
+        self.dropped = 0
+
+    def begin_frame(self) -> None:
+        base = self._row * self._width
+        samples = self._samples
+        for i in range(base, base + self._width):
+            samples[i] = 0.0
+        self._start = self._mark = self._clock()
+
+    def mark(self, phase: int) -> None:
+        """Charge the time since the previous mark to ``phase``."""
+        now = self._clock()
+        self._samples[self._row * self._width + phase] += now - self._mark
+        self._mark = now
+
+    def end_frame(self) -> None:
+        total = self._clock() - self._start
+        self._samples[self._row * self._width + len(PHASES)] = total
+        if total > self.budget * DROP_FACTOR:
+            self.dropped += 1
+        self.frames += 1
+        self._row = (self._row + 1) % self.capacity
+
+    def rows(self) -> List[List[float]]:
+        """Recorded frames, oldest first, as per-phase times plus total."""
+        count = min(self.frames, self.capacity)
+        first = (self._row - count) % self.capacity
+        width = self._width
+        rows = []
+        for n in range(count):
+            base = ((first + n) % self.capacity) * width
+            rows.append(list(self._samples[base : base + width]))
+        return rows
+
+    def summary(self) -> Dict[str, object]:
+        """p50/p95/p99 milliseconds per phase over the buffered frames."""
+        rows = self.rows()
+        result: Dict[str, object] = {
+            "frames": self.frames,
+            "dropped": self.dropped,
+        }
+        for i, name in enumerate(PHASES + ("frame",)):
+            ordered = sorted(row[i] for row in rows)
+            result[name] = {
+                f"p{q}": round(_percentile(ordered, q / 100) * 1000, 3)
+                for q in (50, 95, 99)
+            }
+        return result
+
+    def dump(self, path: str) -> None:
+        """Write the buffered frames in milliseconds as CSV or JSON lines."""
+        columns = PHASES + ("frame",)
+        rows = [[round(t * 1000, 4) for t in row] for row in self.rows()]
+        if path.endswith(".jsonl"):
+            with open(path, "w") as f:
+                for row in rows:
+                    f.write(json.dumps(dict(zip(columns, row))) + "\n")
+            return
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            writer.writerows(rows)
+
+    def format_summary(self, summary: Optional[Dict[str, object]] = None) -> List[str]:
+        """Short text lines for a console report or on-screen overlay."""
+        summary = summary or self.summary()
+        lines = [f"frames {summary['frames']}  dropped {summary['dropped']}"]
+        for name in PHASES + ("frame",):
+            p = summary[name]
+            lines.append(
+                f"{name:<6} {p['p50']:6.2f} {p['p95']:6.2f} {p['p99']:6.2f} ms"
+            )
+        return lines
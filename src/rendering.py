@@ -0,0 +1,265 @@
+"""Pygame drawing for the game state defined in src.game_classes.
+
+The simulation itself never imports this module, so headless runs do not
+pay for pygame or SDL.
+
+Drawing functions take an optional ``lag``: the fraction of a tick to
+step falling objects back along their path, and ``paddle_x``: where to
+draw the paddle. Together they let the game loop render between two
+simulation ticks (see src.timestep).
+"""
+import time
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+
+import pygame
+
+from src.game_classes import (
+    BLACK,
+    BALL_RADIUS,
+    BOMB_RADIUS,
+    PADDLE_HEIGHT,
+    PADDLE_WIDTH,
+    RED,
+    WHITE,
+    YELLOW,
+)
+
+
+def _y(entity, lag: float) -> int:
+    # Speeds are constant, so the position ``lag`` ticks ago is exact
+    if not lag:
+        return entity.y
+    return round(entity.y - entity.speed * lag)
+
+
+def draw_ball(screen, ball, lag: float = 0.0) -> None:
+    pygame.draw.circle(screen, ball.color, (ball.x, _y(ball, lag)), BALL_RADIUS)
+
+
+def draw_bomb(screen, bomb, lag: float = 0.0) -> None:
+    x = bomb.x
+    y = _y(bomb, lag)
+    pygame.draw.circle(screen, YELLOW, (x, y), BOMB_RADIUS)
+    # Draw bomb details (a simple fuse)
+    pygame.draw.line(
+        screen,
+        RED,
+        (x, y - BOMB_RADIUS),
+        (x, y - BOMB_RADIUS - 10),
+        2,
+    )
+    pygame.draw.circle(screen, RED, (x, y - BOMB_RADIUS - 12), 3)
+
+
+def draw_paddle(screen, game, paddle_x: Optional[int] = None):
+    if paddle_x is None:
+        paddle_x = game.paddle_x
+    return pygame.draw.rect(
+        screen, WHITE, (paddle_x, game.paddle_y, PADDLE_WIDTH, PADDLE_HEIGHT)
+    )
+
+
+class SpriteCache:
+    """Ball and bomb images drawn once and reused with ``blit``.
+
+    Sprites are built on first use and converted to the display pixel
+    format when a display mode is set, so blitting them needs no
+    per-frame conversion. Each sprite comes with the offset from the
+    entity position to its top-left corner.
+    """
+
+    def __init__(self):
+        self._balls = {}
+        self._bomb = None
+
+    @staticmethod
+    def _finish(surface):
+        if pygame.display.get_surface() is not None:
+            return surface.convert_alpha()
+        return surface
+
+    def ball(self, color, radius: int = BALL_RADIUS):
+        key = (color, radius)
+        sprite = self._balls.get(key)
+        if sprite is None:
+            surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surface, color, (radius, radius), radius)
+            sprite = (self._finish(surface), (radius, radius))
+            self._balls[key] = sprite
+        return sprite
+
+    def bomb(self):
+        if self._bomb is None:
+            # Same shapes as draw_bomb, with the fuse above the body
+            top = BOMB_RADIUS + 15
+            surface = pygame.Surface(
+                (BOMB_RADIUS * 2, top + BOMB_RADIUS), pygame.SRCALPHA
+            )
+            cx, cy = BOMB_RADIUS, top
+            pygame.draw.circle(surface, YELLOW, (cx, cy), BOMB_RADIUS)
+            pygame.draw.line(
+                surface,
+                RED,
+                (cx, cy - BOMB_RADIUS),
+                (cx, cy - BOMB_RADIUS - 10),
+                2,
+            )
+            pygame.draw.circle(surface, RED, (cx, cy - BOMB_RADIUS - 12), 3)
+            self._bomb = (self._finish(surface), (cx, cy))
+        return self._bomb
+
+    def blit_entities(
+        self, screen, balls, bombs, doreturn: bool = False, lag: float = 0.0
+    ):
+        """Draw all balls and bombs with a single ``Surface.blits`` call."""
+        ball_sprite = self.ball
+        batch = []
+        if lag:
+            for ball in balls:
+                sprite, (ox, oy) = ball_sprite(ball.color)
+                batch.append((sprite, (ball.x - ox, _y(ball, lag) - oy)))
+        else:
+            for ball in balls:
+                sprite, (ox, oy) = ball_sprite(ball.color)
+                batch.append((sprite, (ball.x - ox, ball.y - oy)))
+        sprite, (ox, oy) = self.bomb()
+        for bomb in bombs:
+            batch.append((sprite, (bomb.x - ox, _y(bomb, lag) - oy)))
+        return screen.blits(batch, doreturn)
+
+
+def draw_game(
+    screen,
+    game,
+    sprites: Optional[SpriteCache] = None,
+    lag: float = 0.0,
+    paddle_x: Optional[int] = None,
+) -> None:
+    draw_paddle(screen, game, paddle_x)
+    if sprites is not None:
+        sprites.blit_entities(screen, game.balls, game.bombs, lag=lag)
+        return
+    for ball in game.balls:
+        draw_ball(screen, ball, lag)
+    for bomb in game.bombs:
+        draw_bomb(screen, bomb, lag)
+
+
+class TextCache:
+    """Rendered text surfaces keyed by (font, text, color), LRU bounded.
+
+    HUD and menu strings change rarely, so rasterizing them every frame is
+    wasted work.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._surfaces: "OrderedDict" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def render(self, font, text: str, color, antialias: bool = True):
+        key = (font, text, color, antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+
+
+class DirtyRectRenderer:
+    """Draws the playing screen and reports only the regions that changed.
+
+    Each frame the areas drawn last frame are filled with the background,
+    the paddle, entities and HUD are drawn again, and the union of old and
+    new areas is returned for ``pygame.display.update``. When too many
+    regions change it falls back to a full-screen update.
+    """
+
+    def __init__(
+        self,
+        screen,
+        sprites: Optional[SpriteCache] = None,
+        background=BLACK,
+        max_rects: int = 200,
+    ):
+        self.screen = screen
+        self.sprites = sprites or SpriteCache()
+        self.background = background
+        self.max_rects = max_rects
+        self._previous: List = []
+        self._full = True
+
+    def invalidate(self) -> None:
+        """Force a full redraw, e.g. after another screen was shown."""
+        self._full = True
+
+    def draw_frame(
+        self,
+        game,
+        hud: Sequence[Tuple],
+        lag: float = 0.0,
+        paddle_x: Optional[int] = None,
+    ) -> Optional[List]:
+        """Draw one frame; return dirty rects, or None for the whole screen."""
+        screen = self.screen
+        if self._full:
+            screen.fill(self.background)
+        else:
+            for rect in self._previous:
+                screen.fill(self.background, rect)
+        drawn = [draw_paddle(screen, game, paddle_x)]
+        drawn.extend(
+            self.sprites.blit_entities(screen, game.balls, game.bombs, True, lag)
+        )
+        for surface, position in hud:
+            drawn.append(screen.blit(surface, position))
+        dirty = None if self._full else self._previous + drawn
+        self._previous = drawn
+        self._full = False
+        if dirty is not None and len(dirty) > self.max_rects:
+            return None
+        return dirty
+
+    def present(self, dirty: Optional[List]) -> None:
+        if dirty is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty)
+
+
+class ProfilerOverlay:
+    """``FrameProfiler`` percentiles as HUD surfaces.
+
+    The text is re-rendered at most once per ``interval`` seconds, so the
+    overlay costs almost nothing on other frames.
+    """
+
+    def __init__(self, profiler, font, position=(10, 50), interval: float = 1.0):
+        self.profiler = profiler
+        self.font = font
+        self.position = position
+        self.interval = interval
+        self._rendered_at = float("-inf")
+        self._hud: List[Tuple] = []
+
+    def surfaces(self) -> List[Tuple]:
+        now = time.monotonic()
+        if now - self._rendered_at >= self.interval:
+            self._rendered_at = now
+            x, y = self.position
+            step = self.font.get_linesize()
+            self._hud = [
+                (self.font.render(line, True, WHITE), (x, y + i * step))
+                for i, line in enumerate(self.profiler.format_summary())
+            ]
+        return self._hud
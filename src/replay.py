@@ -0,0 +1,448 @@
+"""Compact binary replays of played sessions.
+
+A replay stores what is needed to re-run a session through ``GameLogic``:
+the spawn seed, player name, difficulty curves and the paddle input of
+every simulated frame. Inputs are run-length encoded, so a long session
+where the player holds a key or stands still takes a few bytes.
+
+Layout (little endian)::
+
+    b"CTBR" | version u8 | seed i64 | 8 x difficulty i32
+    | name length u8 | name utf-8 | run count u32
+    | runs: input u8, frame count varint
+    | keyframe interval u32 | keyframe count u32
+    | index: frame u32, run u32, offset u32, state length u32 per keyframe
+    | keyframe states
+
+Each frame's input is a bit set of ``LEFT``, ``RIGHT`` and ``RESTART``;
+``RESTART`` marks the first frame after the player restarted the game.
+
+Keyframes are optional snapshots of the whole game state taken every
+``interval`` frames (see ``add_keyframes``). ``seek`` restores the one at
+or before the wanted frame and simulates only the rest, so jumping into a
+long session costs at most ``interval`` frames. Version 1 files have no
+keyframe section.
+"""
+import struct
+from typing import List, NamedTuple, Optional, Tuple
+
+from src.game_classes import BALL_COLORS, DEFAULT_DIFFICULTY, Difficulty, GameLogic
+
+MAGIC = b"CTBR"
+VERSION = 2
+
+# One keyframe per minute of play at 60 FPS
+KEYFRAME_INTERVAL = 3600
+
+LEFT = 1
+RIGHT = 2
+RESTART = 4
+
+_HEADER = struct.Struct("<4sBq8i")
+_KEYFRAME = struct.Struct("<4I")
+
+# Game state: paddle x, score, lives, spawn timers and delays, game over,
+# then entity counts
+_STATE = struct.Struct("<7iBHH")
+_BALL = struct.Struct("<3iB")
+_BOMB = struct.Struct("<3i")
+# Spawn stream: Mersenne Twister words, cached gauss, unused block entries
+_RANDOM = struct.Struct("<625I?d")
+_BLOCK_BALL = struct.Struct("<HBB")
+_BLOCK_BOMB = struct.Struct("<HB")
+_COUNT = struct.Struct("<H")
+
+
+def _encode_varint(value: int, out: bytearray) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _decode_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class ReplayError(ValueError):
+    pass
+
+
+def encode_state(game: GameLogic) -> bytes:
+    """Serialize ``game.snapshot()`` for storage in a keyframe."""
+    (
+        paddle_x,
+        score,
+        lives,
+        game_over,
+        ball_timer,
+        bomb_timer,
+        ball_delay,
+        bomb_delay,
+        (balls, bombs),
+        rng_state,
+    ) = game.snapshot()
+    out = bytearray(
+        _STATE.pack(
+            paddle_x,
+            score,
+            lives,
+            ball_timer,
+            bomb_timer,
+            ball_delay,
+            bomb_delay,
+            game_over,
+            len(balls),
+            len(bombs),
+        )
+    )
+    for x, y, speed, color in balls:
+        out += _BALL.pack(x, y, speed, BALL_COLORS.index(color))
+    for bomb in bombs:
+        out += _BOMB.pack(*bomb)
+
+    (_, words, gauss), ball_block, ball_pos, bomb_block, bomb_pos = rng_state
+    out += _RANDOM.pack(*words, gauss is not None, gauss or 0.0)
+    # Only the unused rest of each block matters
+    out += _COUNT.pack(len(ball_block) - ball_pos)
+    for x, speed, color in ball_block[ball_pos:]:
+        out += _BLOCK_BALL.pack(x, speed, BALL_COLORS.index(color))
+    out += _COUNT.pack(len(bomb_block) - bomb_pos)
+    for bomb in bomb_block[bomb_pos:]:
+        out += _BLOCK_BOMB.pack(*bomb)
+    return bytes(out)
+
+
+def decode_state(data: bytes):
+    """Turn ``encode_state`` output back into a ``GameLogic`` snapshot."""
+    (
+        paddle_x,
+        score,
+        lives,
+        ball_timer,
+        bomb_timer,
+        ball_delay,
+        bomb_delay,
+        game_over,
+        n_balls,
+        n_bombs,
+    ) = _STATE.unpack_from(data, 0)
+    pos = _STATE.size
+    end = pos + n_balls * _BALL.size
+    balls = tuple(
+        (x, y, speed, BALL_COLORS[color])
+        for x, y, speed, color in _BALL.iter_unpack(data[pos:end])
+    )
+    pos, end = end, end + n_bombs * _BOMB.size
+    bombs = tuple(_BOMB.iter_unpack(data[pos:end]))
+    pos = end
+
+    *words, has_gauss, gauss = _RANDOM.unpack_from(data, pos)
+    pos += _RANDOM.size
+    random_state = (3, tuple(words), gauss if has_gauss else None)
+    (count,) = _COUNT.unpack_from(data, pos)
+    pos += _COUNT.size
+    end = pos + count * _BLOCK_BALL.size
+    ball_block = [
+        (x, speed, BALL_COLORS[color])
+        for x, speed, color in _BLOCK_BALL.iter_unpack(data[pos:end])
+    ]
+    (count,) = _COUNT.unpack_from(data, end)
+    pos = end + _COUNT.size
+    end = pos + count * _BLOCK_BOMB.size
+    bomb_block = list(_BLOCK_BOMB.iter_unpack(data[pos:end]))
+    return (
+        paddle_x,
+        score,
+        lives,
+        bool(game_over),
+        ball_timer,
+        bomb_timer,
+        ball_delay,
+        bomb_delay,
+        (balls, bombs),
+        (random_state, ball_block, 0, bomb_block, 0),
+    )
+
+
+def restore_state(game: GameLogic, data: bytes) -> None:
+    """Put ``game`` back into a state written by ``encode_state``."""
+    game.restore(decode_state(data))
+
+
+class Keyframe(NamedTuple):
+    frame: int  # frames played before the snapshot
+    run: int  # index of the run holding the next frame
+    offset: int  # frames of that run already played
+    state: bytes
+
+
+class Replay:
+    def __init__(
+        self,
+        seed: int,
+        player_name: str = "Player",
+        difficulty: Difficulty = DEFAULT_DIFFICULTY,
+        runs: Optional[List[Tuple[int, int]]] = None,
+        keyframes: Optional[List[Keyframe]] = None,
+        keyframe_interval: int = KEYFRAME_INTERVAL,
+    ):
+        self.seed = seed
+        self.player_name = player_name
+        self.difficulty = difficulty
+        # (input bits, number of frames) pairs
+        self.runs = runs if runs is not None else []
+        # Snapshots every keyframe_interval frames; rebuild with
+        # add_keyframes after changing runs
+        self.keyframes = keyframes if keyframes is not None else []
+        self.keyframe_interval = keyframe_interval
+
+    @property
+    def frames(self) -> int:
+        return sum(count for _, count in self.runs)
+
+    def inputs(self):
+        """Yield the input bits of every frame in order."""
+        for bits, count in self.runs:
+            for _ in range(count):
+                yield bits
+
+    def encode(self) -> bytes:
+        out = bytearray(_HEADER.pack(MAGIC, VERSION, self.seed, *self.difficulty))
+        name = self.player_name.encode("utf-8")[:255]
+        out.append(len(name))
+        out += name
+        out += struct.pack("<I", len(self.runs))
+        for bits, count in self.runs:
+            out.append(bits)
+            _encode_varint(count, out)
+        out += struct.pack("<II", self.keyframe_interval, len(self.keyframes))
+        for keyframe in self.keyframes:
+            out += _KEYFRAME.pack(
+                keyframe.frame, keyframe.run, keyframe.offset, len(keyframe.state)
+            )
+        for keyframe in self.keyframes:
+            out += keyframe.state
+        return bytes(out)
+
+    @classmethod
+    def decode(cls, data: bytes) -> "Replay":
+        try:
+            magic, version, seed, *curves = _HEADER.unpack_from(data, 0)
+            if magic != MAGIC or version not in (1, VERSION):
+                raise ReplayError("Not a replay file or unsupported version")
+            pos = _HEADER.size
+            name_len = data[pos]
+            name = data[pos + 1 : pos + 1 + name_len].decode("utf-8")
+            pos += 1 + name_len
+            (run_count,) = struct.unpack_from("<I", data, pos)
+            pos += 4
+            runs = []
+            for _ in range(run_count):
+                bits = data[pos]
+                count, pos = _decode_varint(data, pos + 1)
+                runs.append((bits, count))
+            keyframes = []
+            interval = KEYFRAME_INTERVAL
+            if version >= 2:
+                interval, keyframe_count = struct.unpack_from("<II", data, pos)
+                pos += 8
+                index = [
+                    _KEYFRAME.unpack_from(data, pos + i * _KEYFRAME.size)
+                    for i in range(keyframe_count)
+                ]
+                pos += keyframe_count * _KEYFRAME.size
+                for frame, run, offset, length in index:
+                    state = bytes(data[pos : pos + length])
+                    if len(state) != length:
+                        raise ReplayError("Truncated keyframe")
+                    keyframes.append(Keyframe(frame, run, offset, state))
+                    pos += length
+        except (IndexError, struct.error, UnicodeDecodeError) as e:
+            raise ReplayError(f"Truncated or corrupt replay: {e}") from e
+        return cls(seed, name, Difficulty(*curves), runs, keyframes, interval)
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            f.write(self.encode())
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as f:
+            return cls.decode(f.read())
+
+
+class Recorder:
+    """Collects a session's inputs frame by frame.
+
+    ``record`` only compares and bumps a counter unless the input changed,
+    so it is cheap enough to call every frame of the game loop.
+    """
+
+    def __init__(self, game: GameLogic):
+        self.replay = Replay(game.rng.seed, game.player_name, game.difficulty)
+        self._bits = -1
+        self._count = 0
+        self._restart = False
+
+    def restart(self) -> None:
+        """Note that ``reset_game`` was called before the next frame."""
+        self._restart = True
+
+    def record(self, left: bool, right: bool) -> None:
+        bits = (LEFT if left else 0) | (RIGHT if right else 0)
+        if self._restart:
+            bits |= RESTART
+            self._restart = False
+        if bits == self._bits:
+            self._count += 1
+            return
+        if self._count:
+            self.replay.runs.append((self._bits, self._count))
+        self._bits = bits
+        self._count = 1
+
+    def finish(self) -> Replay:
+        if self._count:
+            self.replay.runs.append((self._bits, self._count))
+            self._count = 0
+            self._bits = -1
+        return self.replay
+
+
+def new_game(replay: Replay) -> GameLogic:
+    return GameLogic(
+        replay.player_name,
+        save_scores=False,
+        seed=replay.seed,
+        difficulty=replay.difficulty,
+    )
+
+
+def _run_frames(game: GameLogic, bits: int, count: int) -> None:
+    # Play ``count`` frames holding ``bits``; stops early at game over
+    left = bits & LEFT
+    right = bits & RIGHT
+    while count and not game.game_over:
+        before = game.paddle_x
+        if left:
+            game.move_paddle_left()
+        if right:
+            game.move_paddle_right()
+        if game.paddle_x == before:
+            # Pinned against a wall, or both keys cancelling out: every
+            # remaining frame of the run leaves the paddle here, so idle
+            # frames can be skipped
+            game.advance(count)
+            return
+        game.update_game_state()
+        count -= 1
+
+
+def _play_from(
+    game: GameLogic, runs: List[Tuple[int, int]], run: int, offset: int, frames: int
+) -> Tuple[int, int]:
+    # Play ``frames`` frames starting ``offset`` frames into ``runs[run]``;
+    # return the position reached
+    while frames and run < len(runs):
+        bits, count = runs[run]
+        n = min(count - offset, frames)
+        if offset == 0 and bits & RESTART:
+            game.reset_game()
+            _run_frames(game, bits, 1)
+            if n > 1:
+                _run_frames(game, bits, n - 1)
+        else:
+            _run_frames(game, bits, n)
+        frames -= n
+        offset += n
+        if offset == count:
+            run += 1
+            offset = 0
+    return run, offset
+
+
+def play(replay: Replay, game: Optional[GameLogic] = None) -> GameLogic:
+    """Re-run ``replay`` headlessly as fast as possible; return the game."""
+    if game is None:
+        game = new_game(replay)
+    _play_from(game, replay.runs, 0, 0, replay.frames)
+    return game
+
+
+def add_keyframes(replay: Replay, interval: int = KEYFRAME_INTERVAL) -> Replay:
+    """Play ``replay`` once, storing a keyframe every ``interval`` frames."""
+    if interval < 1:
+        raise ValueError("Keyframe interval must be positive")
+    game = new_game(replay)
+    keyframes = []
+    run = offset = 0
+    total = replay.frames
+    for frame in range(interval, total + 1, interval):
+        run, offset = _play_from(game, replay.runs, run, offset, interval)
+        keyframes.append(Keyframe(frame, run, offset, encode_state(game)))
+    replay.keyframes = keyframes
+    replay.keyframe_interval = interval
+    return replay
+
+
+def seek(replay: Replay, frame: int) -> GameLogic:
+    """Return the game as it was after ``frame`` frames of ``replay``."""
+    if not 0 <= frame <= replay.frames:
+        raise ValueError(f"Frame {frame} is outside the replay")
+    game = new_game(replay)
+    run = offset = start = 0
+    # Keyframes are evenly spaced, so the nearest one is found directly
+    k = min(frame // replay.keyframe_interval, len(replay.keyframes))
+    if k:
+        keyframe = replay.keyframes[k - 1]
+        restore_state(game, keyframe.state)
+        run, offset, start = keyframe.run, keyframe.offset, keyframe.frame
+    _play_from(game, replay.runs, run, offset, frame - start)
+    return game
+
+
+def main(argv=None) -> None:
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Re-run a recorded session")
+    parser.add_argument("replay", help="replay file written by main.py --record")
+    parser.add_argument(
+        "--keyframes",
+        type=int,
+        metavar="FRAMES",
+        help="store a keyframe every FRAMES frames in the file",
+    )
+    parser.add_argument(
+        "--seek", type=int, metavar="FRAME", help="show the state at FRAME"
+    )
+    args = parser.parse_args(argv)
+
+    replay = Replay.load(args.replay)
+    if args.keyframes:
+        add_keyframes(replay, args.keyframes)
+        replay.save(args.replay)
+        print(f"stored {len(replay.keyframes)} keyframes")
+    start = time.perf_counter()
+    if args.seek is not None:
+        game = seek(replay, args.seek)
+    else:
+        game = play(replay)
+    elapsed = time.perf_counter() - start
+    print(f"player {replay.player_name!r}, seed {replay.seed}")
+    frames = replay.frames if args.seek is None else args.seek
+    print(f"{frames} frames replayed in {elapsed:.3f}s")
+    print(f"score {game.score}, lives {game.lives}, game over {game.game_over}")
+
+
+if __name__ == "__main__":
+    main()
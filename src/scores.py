@@ -0,0 +1,291 @@
+"""High score storage.
+
+``ScoreBoard`` keeps the top scores of one JSON file in memory. Its copy
+is refreshed only when the file's modification time or size changes, or
+when the board itself writes, so the game-over screen can ask for scores
+every frame without touching the disk each time.
+
+New scores show up in memory immediately; writing them to disk is left
+to a background ``ScoreWriter`` so the game loop never waits on a file.
+
+Several game processes may share one scores file. Writers take an
+exclusive lock on a ``.lock`` file next to it, merge their new entries
+into the file's current contents and atomically replace it, so no
+finished game is lost and readers never see a partial file.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+import weakref
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+Entry = Dict[str, object]
+
+
+def top_scores(entries: List[Entry], limit: int) -> List[Entry]:
+    # Sort and keep the best entries
+    return sorted(entries, key=lambda x: x["score"], reverse=True)[:limit]
+
+
+class FileLock:
+    """Exclusive lock shared by every process that opens ``path``."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def __enter__(self) -> "FileLock":
+        self._file = open(self.path, "a+")
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        else:
+            self._file.seek(0)
+            while True:
+                try:
+                    # Blocks for up to 10 seconds per attempt
+                    msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        else:
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        self._file.close()
+        self._file = None
+
+
+def _replace(src: str, dst: str, attempts: int = 50) -> None:
+    # On Windows a reader holding dst open makes the rename fail briefly
+    for attempt in range(attempts):
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(0.01)
+
+
+def write_json_atomic(path: str, data: object) -> None:
+    """Write ``data`` to a temp file next to ``path`` and rename it over."""
+    import tempfile  # only needed when writing; keeps imports light
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=".scores-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=4)  # Added indent for readability
+            f.flush()
+            os.fsync(f.fileno())
+        _replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class ScoreWriter:
+    """Runs a write function on a daemon thread.
+
+    ``request()`` never blocks. Requests made while a write is in progress
+    are coalesced into a single follow-up write. ``flush()`` waits until
+    every request made so far has been written.
+    """
+
+    def __init__(self, write: Callable[[], None]):
+        self._write = write
+        self._cond = threading.Condition()
+        self._requested = 0
+        self._done = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def request(self) -> None:
+        with self._cond:
+            self._requested += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="score-writer", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._done == self._requested:
+                    self._cond.wait()
+                target = self._requested
+            try:
+                self._write()
+            finally:
+                with self._cond:
+                    self._done = target
+                    self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self._done == self._requested, timeout
+            )
+
+
+class ScoreBoard:
+    def __init__(
+        self,
+        path: str,
+        limit: int = 10,
+        check_interval: float = 0.5,
+        background: bool = True,
+    ):
+        self.path = path
+        self.limit = limit
+        # Minimum seconds between stat() calls looking for outside changes
+        self.check_interval = check_interval
+        self._entries: List[Entry] = []
+        self._pending: List[Entry] = []
+        self._signature: Optional[Tuple[int, int]] = None
+        self._checked_at = float("-inf")
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._writer = ScoreWriter(self._write_pending) if background else None
+        track_store(self)
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _read_file(self) -> List[Entry]:
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, "r") as f:
+            return json.load(f)
+
+    def _read(self) -> None:
+        if not os.path.exists(self.path):
+            # Create file with empty array if it doesn't exist, under the lock
+            # and only if no other writer created it in the meantime
+            with FileLock(self.path + ".lock"):
+                if not os.path.exists(self.path):
+                    write_json_atomic(self.path, [])
+        # Stat first: if the file is replaced while we read, the signature
+        # is then stale and the next check reads it again
+        signature = self._stat()
+        entries = self._read_file()
+        # Scores still queued for writing are not on disk yet
+        self._entries = top_scores(entries + self._pending, self.limit)
+        self._signature = signature
+        self._loaded = True
+
+    def invalidate(self) -> None:
+        self._loaded = False
+
+    def load(self) -> List[Entry]:
+        """Return the stored scores, best first."""
+        try:
+            with self._lock:
+                now = time.monotonic()
+                if self._loaded and now - self._checked_at < self.check_interval:
+                    return list(self._entries)
+                self._checked_at = now
+                if not self._loaded or self._stat() != self._signature:
+                    self._read()
+                return list(self._entries)
+        except Exception as e:
+            print(f"Error loading scores: {e}")  # For debugging
+            return []
+
+    def add(self, name: str, score: int) -> None:
+        entry = {"name": name, "score": score}
+        with self._lock:
+            self._entries = top_scores(self._entries + [entry], self.limit)
+            self._pending.append(entry)
+        if self._writer is not None:
+            self._writer.request()
+        else:
+            self._write_pending()
+
+    def _write_pending(self) -> None:
+        with self._io_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+            if not pending:
+                return
+            try:
+                # Merge into what is on disk now rather than our cached copy,
+                # under the lock so concurrent writers cannot drop our entries
+                with FileLock(self.path + ".lock"):
+                    scores = top_scores(self._read_file() + pending, self.limit)
+                    write_json_atomic(self.path, scores)
+                    # Before releasing the lock, so the signature cannot
+                    # belong to another writer's file
+                    signature = self._stat()
+            except Exception as e:
+                print(f"Error saving score: {e}")  # For debugging
+                with self._lock:
+                    # Keep them queued for the next write or flush()
+                    self._pending = pending + self._pending
+                return
+            with self._lock:
+                self._entries = top_scores(scores + self._pending, self.limit)
+                self._signature = signature
+                self._checked_at = time.monotonic()
+                self._loaded = True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued scores to reach the disk; False if they did not."""
+        with self._lock:
+            retry = bool(self._pending)
+        # Scores left over from a failed write get another attempt
+        if self._writer is None:
+            if retry:
+                self._write_pending()
+        elif retry:
+            self._writer.request()
+        if self._writer is not None and not self._writer.flush(timeout):
+            return False
+        with self._lock:
+            return not self._pending
+
+
+_boards: Dict[str, ScoreBoard] = {}
+# Every live score store, so flush_all can reach them on exit
+_stores: "weakref.WeakSet" = weakref.WeakSet()
+
+
+def track_store(store) -> None:
+    _stores.add(store)
+
+
+def get_scoreboard(path: str) -> ScoreBoard:
+    """Return the shared ``ScoreBoard`` for ``path``."""
+    key = os.path.abspath(path)
+    board = _boards.get(key)
+    if board is None:
+        board = _boards[key] = ScoreBoard(path)
+    return board
+
+
+@atexit.register
+def flush_all(timeout: Optional[float] = 5.0) -> None:
+    """Write out every store's queued scores, e.g. when the game quits."""
+    for store in list(_stores):
+        store.flush(timeout)
@@ -0,0 +1,56 @@
+"""Headless game runner.
+
+Only depends on src.game_classes, so it runs without pygame or a display.
+Used for balancing experiments and paddle bots.
+"""
+from typing import Callable, Optional
+
+from src.game_classes import PADDLE_WIDTH, GameLogic
+
+# Paddle actions, mirroring the LEFT/RIGHT arrow keys in main()
+STAY = 0
+LEFT = -1
+RIGHT = 1
+
+Policy = Callable[[GameLogic], int]
+
+
+def stationary(game: GameLogic) -> int:
+    return STAY
+
+
+def follow_lowest_ball(game: GameLogic) -> int:
+    # Chase the ball closest to the paddle, ignoring bombs
+    if not game.balls:
+        return STAY
+    target = max(game.balls, key=lambda ball: ball.y)
+    center = game.paddle_x + PADDLE_WIDTH // 2
+    if target.x < center - game.paddle_speed:
+        return LEFT
+    if target.x > center + game.paddle_speed:
+        return RIGHT
+    return STAY
+
+
+def apply_action(game: GameLogic, action: int) -> None:
+    if action < 0:
+        game.move_paddle_left()
+    elif action > 0:
+        game.move_paddle_right()
+
+
+def run_headless(
+    game: GameLogic,
+    policy: Optional[Policy] = None,
+    max_frames: int = 60 * 60 * 10,
+) -> int:
+    """Step ``game`` until it ends or ``max_frames`` pass; return frames run."""
+    if policy is None or policy is stationary:
+        # Nothing moves the paddle, so idle frames can be skipped
+        return game.advance(max_frames)
+    frames = 0
+    while not game.game_over and frames < max_frames:
+        apply_action(game, policy(game))
+        game.update_game_state()
+        frames += 1
+    return frames
@@ -0,0 +1,48 @@
+"""Fixed-timestep scheduling for the game loop.
+
+Gameplay is defined per tick: balls fall ``speed`` pixels, the paddle
+moves ``paddle_speed`` pixels and spawn timers count one per tick. The
+window may redraw faster or slower than that, so wall-clock time is
+collected in an accumulator and converted into whole ticks. What is left
+over, as a fraction of a tick, tells the renderer how far to interpolate
+between the last two ticks.
+"""
+import time
+from typing import Callable
+
+TICK_RATE = 60
+
+
+class FixedTimestep:
+    def __init__(
+        self,
+        tick_rate: int = TICK_RATE,
+        max_ticks: int = 5,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.dt = 1.0 / tick_rate
+        # More ticks than this per frame and the game slows down instead,
+        # so a long stall cannot snowball into ever longer catch-ups
+        self.max_ticks = max_ticks
+        self._clock = clock
+        self.reset()
+
+    def reset(self) -> None:
+        """Start counting from now, e.g. after a pause or menu."""
+        self._last = self._clock()
+        self.accumulator = 0.0
+
+    def ticks(self) -> int:
+        """Ticks to simulate for the time passed since the last call."""
+        now = self._clock()
+        elapsed = max(0.0, now - self._last)
+        self._last = now
+        self.accumulator = min(self.accumulator + elapsed, self.max_ticks * self.dt)
+        ticks = int(self.accumulator / self.dt)
+        self.accumulator -= ticks * self.dt
+        return ticks
+
+    @property
+    def alpha(self) -> float:
+        """How far the present lies between the last tick and the next, 0-1."""
+        return min(1.0, self.accumulator / self.dt)
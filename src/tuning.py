@@ -0,0 +1,204 @@
+"""Monte Carlo evaluation of spawn-delay curves.
+
+Plays many seeded headless games per candidate ``Difficulty`` across a
+process pool and reports score and survival-time distributions. Results
+are cached per (candidate, seed, policy, frame cap) in a JSON file, so
+re-running with more seeds or extra candidates only plays the new games.
+
+Example::
+
+    python -m src.tuning --games 2000 \\
+        --candidate ball_min_delay=20 --candidate bomb_delay_step=10
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+# Allow running as a script as well as with -m
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from src.game_classes import DEFAULT_DIFFICULTY, Difficulty, GameLogic
+from src.simulation import follow_lowest_ball, run_headless, stationary
+
+FPS = 60
+POLICIES = {"follow": follow_lowest_ball, "stationary": stationary}
+DEFAULT_CACHE_FILE = os.path.join(
+    os.path.dirname(__file__), "..", "tuning_cache.json"
+)
+
+
+class Summary(NamedTuple):
+    games: int
+    mean_score: float
+    score_percentiles: Tuple[float, float, float]
+    mean_survival: float
+    survival_percentiles: Tuple[float, float, float]
+    survived_cap: float
+
+
+def play_game(
+    difficulty: Difficulty, seed: int, policy: str, max_frames: int
+) -> Tuple[int, int]:
+    """Play one headless game; return ``(score, frames survived)``."""
+    game = GameLogic(save_scores=False, seed=seed, difficulty=difficulty)
+    frames = run_headless(game, POLICIES[policy], max_frames)
+    return game.score, frames
+
+
+def _play_job(job: Tuple[Difficulty, int, str, int]) -> Tuple[int, int]:
+    return play_game(*job)
+
+
+def _cache_key(difficulty: Difficulty, seed: int, policy: str, max_frames: int) -> str:
+    return json.dumps([list(difficulty), seed, policy, max_frames])
+
+
+class ResultCache:
+    """(config, seed) -> (score, frames) results persisted as JSON."""
+
+    def __init__(self, path: Optional[str] = DEFAULT_CACHE_FILE):
+        self.path = path
+        self.results: Dict[str, List[int]] = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    self.results = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable tuning cache: {e}")
+
+    def get(self, key: str) -> Optional[Tuple[int, int]]:
+        result = self.results.get(key)
+        return None if result is None else (result[0], result[1])
+
+    def put(self, key: str, result: Tuple[int, int]) -> None:
+        self.results[key] = list(result)
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.results, f)
+        os.replace(tmp, self.path)
+
+
+def _percentiles(values: Sequence[float]) -> Tuple[float, float, float]:
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    return tuple(ordered[round(q * last)] for q in (0.1, 0.5, 0.9))  # type: ignore
+
+
+def summarize(results: Sequence[Tuple[int, int]], max_frames: int) -> Summary:
+    scores = [score for score, _ in results]
+    seconds = [frames / FPS for _, frames in results]
+    return Summary(
+        games=len(results),
+        mean_score=sum(scores) / len(scores),
+        score_percentiles=_percentiles(scores),
+        mean_survival=sum(seconds) / len(seconds),
+        survival_percentiles=_percentiles(seconds),
+        survived_cap=sum(f >= max_frames for _, f in results) / len(results),
+    )
+
+
+def evaluate(
+    candidates: Iterable[Difficulty],
+    seeds: Sequence[int],
+    policy: str = "follow",
+    max_frames: int = FPS * 60 * 10,
+    workers: Optional[int] = None,
+    cache: Optional[ResultCache] = None,
+) -> Dict[Difficulty, Summary]:
+    """Play every candidate on every seed and summarize each candidate."""
+    if cache is None:
+        cache = ResultCache(None)
+    candidates = list(candidates)
+    missing = []
+    for difficulty in candidates:
+        for seed in seeds:
+            if cache.get(_cache_key(difficulty, seed, policy, max_frames)) is None:
+                missing.append((difficulty, seed, policy, max_frames))
+
+    if missing:
+        workers = workers or os.cpu_count() or 1
+        chunksize = max(1, len(missing) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for job, result in zip(
+                missing, pool.map(_play_job, missing, chunksize=chunksize)
+            ):
+                cache.put(_cache_key(*job), result)
+        cache.save()
+
+    summaries = {}
+    for difficulty in candidates:
+        results = [
+            cache.get(_cache_key(difficulty, seed, policy, max_frames))
+            for seed in seeds
+        ]
+        summaries[difficulty] = summarize(results, max_frames)  # type: ignore
+    return summaries
+
+
+def parse_candidate(text: str) -> Difficulty:
+    """Parse ``name=value,name=value`` overrides of the default curves."""
+    overrides = {}
+    for part in filter(None, text.split(",")):
+        name, _, value = part.partition("=")
+        name = name.strip()
+        if name not in Difficulty._fields:
+            raise ValueError(f"Unknown difficulty parameter: {name}")
+        overrides[name] = int(value)
+    return DEFAULT_DIFFICULTY._replace(**overrides)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--candidate",
+        action="append",
+        default=[],
+        help="name=value overrides of the default curves (repeatable)",
+    )
+    parser.add_argument("--games", type=int, default=1000, help="seeds per candidate")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="follow")
+    parser.add_argument("--max-seconds", type=int, default=600)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cache", default=DEFAULT_CACHE_FILE)
+    args = parser.parse_args(argv)
+
+    candidates = [DEFAULT_DIFFICULTY] + [parse_candidate(c) for c in args.candidate]
+    seeds = range(args.first_seed, args.first_seed + args.games)
+    summaries = evaluate(
+        candidates,
+        seeds,
+        policy=args.policy,
+        max_frames=args.max_seconds * FPS,
+        workers=args.workers,
+        cache=ResultCache(args.cache or None),
+    )
+    for difficulty, summary in summaries.items():
+        changed = {
+            name: value
+            for name, value in difficulty._asdict().items()
+            if value != getattr(DEFAULT_DIFFICULTY, name)
+        }
+        print(changed or "default")
+        print(
+            "  score     mean {:.1f}  p10/p50/p90 {}/{}/{}".format(
+                summary.mean_score, *summary.score_percentiles
+            )
+        )
+        print(
+            "  survival  mean {:.1f}s  p10/p50/p90 {:.1f}/{:.1f}/{:.1f}s".format(
+                summary.mean_survival, *summary.survival_percentiles
+            )
+        )
+        print(f"  reached the {args.max_seconds}s cap: {summary.survived_cap:.1%}")
+
+
+if __name__ == "__main__":
+    main()
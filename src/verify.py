@@ -0,0 +1,147 @@
+"""Verify submitted high scores by replaying them.
+
+A submission is a recorded replay (seed, player name, difficulty and
+inputs, see ``src.replay``) together with the score and lives the player
+claims to have finished with. Each replay is re-run headlessly and the
+claim is accepted only if the final game matches it exactly.
+
+Batches are spread over a process pool. Replays run far above real time
+because idle stretches are skipped with ``GameLogic.advance``.
+
+Example::
+
+    python -m src.verify claims.json --scores scores.json
+
+where ``claims.json`` is a list of ``{"replay": path, "score": n}``
+objects, optionally with ``"lives"`` (0 when omitted: the game ended).
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Collection, List, NamedTuple, Optional, Sequence
+
+# Allow running as a script as well as with -m
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from src.game_classes import DEFAULT_DIFFICULTY, Difficulty
+from src.replay import Replay, ReplayError, play
+from src.scores import ScoreBoard
+
+# Longest session worth replaying: one hour at 60 FPS
+MAX_FRAMES = 60 * 60 * 60
+# Scores are only comparable when earned on the same curves
+ACCEPTED_DIFFICULTIES = (DEFAULT_DIFFICULTY,)
+
+
+class Submission(NamedTuple):
+    replay: bytes  # encoded Replay
+    score: int
+    lives: int = 0
+
+
+class Verdict(NamedTuple):
+    accepted: bool
+    player_name: str
+    score: int  # as replayed
+    lives: int
+    reason: str = ""
+
+
+def check(
+    submission: Submission,
+    max_frames: int = MAX_FRAMES,
+    difficulties: Collection[Difficulty] = ACCEPTED_DIFFICULTIES,
+) -> Verdict:
+    """Replay one submission and compare the result with its claim."""
+    try:
+        replay = Replay.decode(submission.replay)
+    except ReplayError as e:
+        return Verdict(False, "", 0, 0, str(e))
+    if replay.frames > max_frames:
+        return Verdict(False, replay.player_name, 0, 0, "replay too long")
+    if replay.difficulty not in difficulties:
+        return Verdict(False, replay.player_name, 0, 0, "non-standard difficulty")
+    try:
+        game = play(replay)
+    except Exception as e:
+        # A crafted replay must not take the rest of the batch down with it
+        return Verdict(False, replay.player_name, 0, 0, f"replay failed: {e!r}")
+    if (game.score, game.lives) != (submission.score, submission.lives):
+        reason = (
+            f"claimed score {submission.score} and {submission.lives} lives, "
+            f"replay ends with {game.score} and {game.lives}"
+        )
+        return Verdict(False, replay.player_name, game.score, game.lives, reason)
+    return Verdict(True, replay.player_name, game.score, game.lives)
+
+
+def verify(
+    submissions: Sequence[Submission],
+    workers: Optional[int] = None,
+    max_frames: int = MAX_FRAMES,
+    difficulties: Collection[Difficulty] = ACCEPTED_DIFFICULTIES,
+) -> List[Verdict]:
+    """Check every submission; verdicts come back in submission order."""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(submissions) < 2:
+        return [
+            check(submission, max_frames, difficulties) for submission in submissions
+        ]
+    chunksize = max(1, len(submissions) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(
+            pool.map(
+                check,
+                submissions,
+                [max_frames] * len(submissions),
+                [difficulties] * len(submissions),
+                chunksize=chunksize,
+            )
+        )
+
+
+def load_claims(path: str) -> List[Submission]:
+    """Read a claims file; replay paths are relative to it."""
+    with open(path, "r") as f:
+        claims = json.load(f)
+    directory = os.path.dirname(os.path.abspath(path))
+    submissions = []
+    for claim in claims:
+        with open(os.path.join(directory, claim["replay"]), "rb") as f:
+            replay = f.read()
+        submissions.append(Submission(replay, claim["score"], claim.get("lives", 0)))
+    return submissions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    import time
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("claims", help="JSON list of replay/score claims")
+    parser.add_argument(
+        "--scores", help="add accepted scores to this scores file"
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    submissions = load_claims(args.claims)
+    start = time.perf_counter()
+    verdicts = verify(submissions, workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    board = ScoreBoard(args.scores, background=False) if args.scores else None
+    accepted = 0
+    for verdict in verdicts:
+        if verdict.accepted:
+            accepted += 1
+            if board is not None:
+                board.add(verdict.player_name, verdict.score)
+        else:
+            print(f"rejected {verdict.player_name!r}: {verdict.reason}")
+    print(f"{accepted} of {len(verdicts)} accepted in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
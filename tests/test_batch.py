@@ -0,0 +1,107 @@
+# Add project root to sys.path to fix import issues
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.batch import GameBatch
+from src.game_classes import Ball, Bomb, GameLogic, BALL_COLORS, HEIGHT, WIDTH
+
+
+def mirror_batch(n, seed):
+    """Fill a batch and n GameLogic instances with identical entities."""
+    rng = random.Random(seed)
+    batch = GameBatch(n, seed=seed)
+    batch.balls.clear()
+    batch.bombs.clear()
+    games = []
+    for g in range(n):
+        game = GameLogic(save_scores=False)
+        game.balls = []
+        for _ in range(40):
+            ball = Ball()
+            ball.x = rng.randint(15, WIDTH - 15)
+            ball.y = rng.randint(0, HEIGHT)
+            game.balls.append(ball)
+            batch.balls.extend_for(
+                [g], [ball.x], ball.y, ball.speed, BALL_COLORS.index(ball.color)
+            )
+        for _ in range(15):
+            bomb = Bomb()
+            bomb.x = rng.randint(20, WIDTH - 20)
+            bomb.y = rng.randint(0, HEIGHT)
+            game.bombs.append(bomb)
+            batch.bombs.extend_for([g], [bomb.x], bomb.y, bomb.speed)
+        game.ball_spawn_delay = game.bomb_spawn_delay = 10 ** 9
+        games.append(game)
+    batch.ball_spawn_delay[:] = 10 ** 9
+    batch.bomb_spawn_delay[:] = 10 ** 9
+    return batch, games
+
+
+class TestGameBatch:
+    def test_initial_state(self):
+        batch = GameBatch(8, seed=0)
+        assert len(batch.balls) == 8
+        assert len(batch.bombs) == 0
+        assert (batch.lives == 3).all()
+        assert (batch.ball_spawn_delay == 60).all()
+        assert (batch.bomb_spawn_delay == 180).all()
+
+    def test_matches_game_logic(self):
+        n = 16
+        batch, games = mirror_batch(n, seed=5)
+        rng = random.Random(5)
+        for _ in range(200):
+            actions = [rng.choice((-1, 0, 1)) for _ in range(n)]
+            batch.step(actions)
+            for game, action in zip(games, actions):
+                if game.game_over:
+                    continue
+                if action < 0:
+                    game.move_paddle_left()
+                elif action > 0:
+                    game.move_paddle_right()
+                game.update_game_state()
+            assert list(batch.score) == [game.score for game in games]
+            assert list(batch.lives) == [game.lives for game in games]
+            assert list(batch.game_over) == [game.game_over for game in games]
+
+    def test_spawn_delay_curves(self):
+        batch = GameBatch(3, seed=1)
+        batch.score[:] = [0, 12, 200]
+        batch.ball_spawn_timer[:] = batch.ball_spawn_delay - 1
+        batch.bomb_spawn_timer[:] = batch.bomb_spawn_delay - 1
+        balls_before = len(batch.balls)
+        # Keep the paddle clear of the initial balls so scores stay fixed
+        batch.balls.x[: len(batch.balls)] = WIDTH - 15
+        batch.paddle_x[:] = 0
+        batch.step()
+        assert len(batch.balls) == balls_before + 3
+        assert len(batch.bombs) == 3
+        assert list(batch.ball_spawn_delay) == [60, 50, 15]
+        assert list(batch.bomb_spawn_delay) == [180, 165, 60]
+        assert (batch.ball_spawn_timer == 0).all()
+
+    def test_game_over_freezes_game(self):
+        batch = GameBatch(2, seed=2)
+        batch.game_over[0] = True
+        batch.ball_spawn_timer[:] = 5
+        batch.step([1, 1])
+        assert list(batch.ball_spawn_timer) == [5, 6]
+
+    def test_reset_subset(self):
+        batch = GameBatch(4, seed=3)
+        batch.score[:] = 9
+        batch.lives[:] = 0
+        batch.game_over[:] = True
+        batch.reset([1, 3])
+        assert list(batch.score) == [9, 0, 9, 0]
+        assert list(batch.game_over) == [True, False, True, False]
+        owners = sorted(batch.balls.game[: len(batch.balls)].tolist())
+        assert owners == [0, 1, 2, 3]
@@ -0,0 +1,58 @@
+# Add project root to sys.path to fix import issues
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+
+from src import benchmark
+from src.benchmark import Benchmark, Result, regressions
+
+
+class TestBenchmarkSuite:
+    def test_measure_reports_per_operation_time(self):
+        calls = []
+        seconds = benchmark.measure(lambda: calls.append(1), ops=10, repeat=2, min_time=0.001)
+        assert len(calls) > 2
+        assert 0 < seconds < 0.001
+
+    def test_regressions_use_threshold(self):
+        results = [
+            Result("fast", 1.0, 1.0),
+            Result("slower", 1.2, 1.0),
+            Result("slow", 1.5, 1.0),
+            Result("new", 9.0, None),
+        ]
+        assert [r.name for r in regressions(results, 0.25)] == ["slow"]
+        assert [r.name for r in regressions(results, 0.1)] == ["slower", "slow"]
+
+    def test_every_benchmark_runs(self):
+        results = benchmark.run(benchmark.default_benchmarks(), repeat=1, min_time=0)
+        assert len(results) == len(benchmark.default_benchmarks())
+        assert all(result.seconds > 0 for result in results)
+
+    def test_update_benchmarks_keep_their_entity_count(self):
+        game = benchmark._update(10).setup().__self__
+        for _ in range(1000):
+            game.update_game_state()
+        assert len(game.balls) + len(game.bombs) == 20
+
+        run = benchmark._update_crossing(100).setup()
+        for _ in range(2):
+            run()
+            # Everything crossed the paddle band and was caught or culled
+            assert run.game.balls == run.game.bombs == []
+            assert run.game.score > 0
+
+    def test_baseline_roundtrip_and_exit_status(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "baseline.json")
+        fake = [Benchmark("fake/op", lambda: (lambda: None))]
+        monkeypatch.setattr(benchmark, "default_benchmarks", lambda: fake)
+        assert benchmark.main(["--baseline", path, "--save", "--repeat", "1"]) == 0
+        with open(path) as f:
+            assert set(json.load(f)) == {"fake/op"}
+
+        # Pretend the baseline was ten times faster than now
+        with open(path, "w") as f:
+            json.dump({"fake/op": 1e-12}, f)
+        assert benchmark.main(["--baseline", path, "--repeat", "1"]) == 1
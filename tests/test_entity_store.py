@@ -0,0 +1,147 @@
+# Add project root to sys.path to fix import issues
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.entity_store import ArrayGameLogic, EntityArrays
+from src.game_classes import (
+    Ball, Bomb, GameLogic, BALL_COLORS, BALL_RADIUS, BOMB_RADIUS, HEIGHT, PADDLE_WIDTH
+)
+
+
+def mirror_game(seed, balls=200, bombs=50):
+    """Build an object-based game and an array-based game with equal entities."""
+    rng = random.Random(seed)
+    game = GameLogic(save_scores=False)
+    arrays = ArrayGameLogic(save_scores=False)
+    game.balls = []
+    arrays.balls.clear()
+    for _ in range(balls):
+        ball = Ball()
+        ball.x = rng.randint(BALL_RADIUS, 800 - BALL_RADIUS)
+        ball.y = rng.randint(-BALL_RADIUS, HEIGHT)
+        ball.speed = rng.randint(3, 7)
+        game.balls.append(ball)
+        arrays.balls.append(ball.x, ball.y, ball.speed, BALL_COLORS.index(ball.color))
+    for _ in range(bombs):
+        bomb = Bomb()
+        bomb.x = rng.randint(BOMB_RADIUS, 800 - BOMB_RADIUS)
+        bomb.y = rng.randint(-BOMB_RADIUS, HEIGHT)
+        game.bombs.append(bomb)
+        arrays.bombs.append(bomb.x, bomb.y, bomb.speed)
+    # Keep spawns out of the comparison, they draw from different generators
+    for g in (game, arrays):
+        g.lives = 1000
+        g.ball_spawn_delay = g.bomb_spawn_delay = 10 ** 9
+    return game, arrays
+
+
+class TestEntityArrays:
+    def test_append_grows(self):
+        store = EntityArrays(BALL_RADIUS, BALL_COLORS, capacity=2)
+        for i in range(10):
+            store.append(i, i * 2, 3, i % 3)
+        assert len(store) == 10
+        assert [view.x for view in store] == list(range(10))
+        assert list(store)[4].color == BALL_COLORS[1]
+
+    def test_step_catch_and_miss(self):
+        store = EntityArrays(BALL_RADIUS, BALL_COLORS)
+        paddle_x, paddle_y = 350, HEIGHT - 40
+        store.append(paddle_x + PADDLE_WIDTH // 2, paddle_y - BALL_RADIUS - 3, 3)
+        store.append(100, HEIGHT, 3)
+        store.append(100, 0, 3)
+        caught, missed = store.step(paddle_x, paddle_y)
+        assert (caught, missed) == (1, 1)
+        assert len(store) == 1
+        assert store.y[0] == 3
+
+
+class TestArrayGameLogic:
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_object_logic(self, seed):
+        game, arrays = mirror_game(seed)
+        rng = random.Random(seed)
+        for _ in range(300):
+            if rng.random() < 0.5:
+                game.move_paddle_left()
+                arrays.move_paddle_left()
+            else:
+                game.move_paddle_right()
+                arrays.move_paddle_right()
+            game.update_game_state()
+            arrays.update_game_state()
+            assert arrays.score == game.score
+            assert arrays.lives == game.lives
+            assert sorted((b.x, b.y) for b in arrays.balls) == sorted(
+                (b.x, b.y) for b in game.balls
+            )
+            assert len(arrays.bombs) == len(game.bombs)
+
+    def test_seeded_game_matches_object_logic(self):
+        # Both draw spawns from the same SpawnStream sequence
+        game = GameLogic(save_scores=False, seed=21)
+        arrays = ArrayGameLogic(save_scores=False, seed=21)
+        for frame in range(3000):
+            for g in (game, arrays):
+                if frame % 120 < 60:
+                    g.move_paddle_left()
+                else:
+                    g.move_paddle_right()
+                g.update_game_state()
+            assert (arrays.score, arrays.lives) == (game.score, game.lives)
+        assert [(b.x, b.y) for b in arrays.balls] == [(b.x, b.y) for b in game.balls]
+
+    def test_fast_forward_matches_stepping(self):
+        stepped = ArrayGameLogic(save_scores=False, seed=4, spawn_batch=20)
+        jumped = ArrayGameLogic(save_scores=False, seed=4, spawn_batch=20)
+        jumped.lives = stepped.lives = 50
+        for _ in range(3000):
+            stepped.update_game_state()
+        jumped.advance(3000)
+        assert (jumped.score, jumped.lives) == (stepped.score, stepped.lives)
+        assert [(b.x, b.y) for b in jumped.bombs] == [(b.x, b.y) for b in stepped.bombs]
+
+    def test_snapshot_restore(self):
+        game = ArrayGameLogic(save_scores=False, seed=5, spawn_batch=50)
+        game.lives = 1000
+        game.advance(500)
+        snapshot = game.snapshot()
+        game.advance(1000)
+        expected = (game.score, game.lives, [tuple(b) for b in game.balls])
+        game.restore(snapshot)
+        assert len(game.balls) == len(snapshot[8][0][0])
+        game.advance(1000)
+        assert (game.score, game.lives, [tuple(b) for b in game.balls]) == expected
+
+    def test_spawn_batch(self):
+        game = ArrayGameLogic(save_scores=False, spawn_batch=1000)
+        game.ball_spawn_timer = game.ball_spawn_delay - 1
+        game.bomb_spawn_timer = game.bomb_spawn_delay - 1
+        game.update_game_state()
+        assert len(game.balls) == 1001
+        assert len(game.bombs) == 1000
+        assert game.ball_spawn_timer == 0
+
+    def test_bomb_ends_game(self):
+        game = ArrayGameLogic(save_scores=False)
+        game.lives = 1
+        game.bombs.append(game.paddle_x + 10, game.paddle_y - BOMB_RADIUS, 2)
+        game.update_game_state()
+        assert game.lives == 0
+        assert game.game_over
+
+    def test_reset_game(self):
+        game = ArrayGameLogic(save_scores=False, spawn_batch=10)
+        game.bombs.append(100, 100, 2)
+        game.game_over = True
+        game.reset_game()
+        assert len(game.balls) == 1
+        assert len(game.bombs) == 0
+        assert not game.game_over
@@ -6,8 +6,9 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 import pytest
 import pygame
 import random
+from collections import Counter
 from unittest.mock import patch, MagicMock
-from src.game_classes import Ball, Bomb, GameLogic, WIDTH, HEIGHT, BALL_RADIUS, BOMB_RADIUS, PADDLE_WIDTH, BALL_COLORS
+from src.game_classes import Ball, Bomb, GameLogic, SpawnStream, WIDTH, HEIGHT, BALL_RADIUS, BOMB_RADIUS, PADDLE_WIDTH, BALL_COLORS
 
 
 # Initialize pygame for tests
@@ -580,4 +581,287 @@ class TestGameLogic:
         game.move_paddle_right()
         assert game.paddle_x == WIDTH - PADDLE_WIDTH  # Should stop at right edge
         game.move_paddle_right()
-        assert game.paddle_x == WIDTH - PADDLE_WIDTH  # Should remain at right edge
\ No newline at end of file
+        assert game.paddle_x == WIDTH - PADDLE_WIDTH  # Should remain at right edge
+
+class TestSpawnStream:
+    def test_same_seed_same_params(self):
+        a = SpawnStream(42, block_size=8)
+        b = SpawnStream(42, block_size=8)
+        assert [a.next_ball() for _ in range(20)] == [b.next_ball() for _ in range(20)]
+        assert [a.next_bomb() for _ in range(20)] == [b.next_bomb() for _ in range(20)]
+
+    def test_param_ranges(self):
+        stream = SpawnStream(1)
+        for _ in range(500):
+            x, speed, color = stream.next_ball()
+            assert BALL_RADIUS <= x <= WIDTH - BALL_RADIUS
+            assert 3 <= speed <= 7
+            assert color in BALL_COLORS
+            x, speed = stream.next_bomb()
+            assert BOMB_RADIUS <= x <= WIDTH - BOMB_RADIUS
+            assert 2 <= speed <= 5
+
+    def test_entities_use_stream(self):
+        stream = SpawnStream(3)
+        expected = SpawnStream(3)
+        ball = Ball(stream)
+        x, speed, color = expected.next_ball()
+        assert (ball.x, ball.y, ball.speed, ball.color) == (x, 0, speed, color)
+        ball.reset()
+        x, speed, color = expected.next_ball()
+        assert (ball.x, ball.y, ball.speed, ball.color) == (x, -BALL_RADIUS, speed, color)
+        bomb = Bomb(stream)
+        assert (bomb.x, bomb.speed) == expected.next_bomb()
+
+    def test_seeded_games_are_reproducible(self):
+        def play(seed):
+            game = GameLogic(save_scores=False, seed=seed)
+            for frame in range(2000):
+                if frame % 90 < 45:
+                    game.move_paddle_left()
+                else:
+                    game.move_paddle_right()
+                game.update_game_state()
+            return game.score, game.lives, [(b.x, b.y) for b in game.balls]
+
+        assert play(11) == play(11)
+        assert play(11) != play(12)
+
+
+class TestFastForward:
+    @staticmethod
+    def _state(game):
+        return (
+            game.score,
+            game.lives,
+            game.game_over,
+            game.ball_spawn_timer,
+            game.bomb_spawn_timer,
+            game.ball_spawn_delay,
+            game.bomb_spawn_delay,
+            [(b.x, b.y) for b in game.balls],
+            [(b.x, b.y) for b in game.bombs],
+        )
+
+    @pytest.mark.parametrize("seed", [1, 2, 3, 4])
+    def test_matches_frame_stepping(self, seed):
+        stepped = GameLogic(save_scores=False, seed=seed)
+        jumped = GameLogic(save_scores=False, seed=seed)
+        rng = random.Random(seed)
+        # Stationary stretches broken up by scripted paddle moves
+        for _ in range(40):
+            frames = rng.randint(1, 400)
+            for _ in range(frames):
+                stepped.update_game_state()
+            assert jumped.advance(frames) <= frames
+            assert self._state(jumped) == self._state(stepped)
+            moves = rng.randint(0, 10)
+            for g in (stepped, jumped):
+                for _ in range(moves):
+                    g.move_paddle_left() if seed % 2 else g.move_paddle_right()
+
+    def test_skips_idle_frames(self):
+        game = GameLogic(save_scores=False, seed=9)
+        calls = 0
+        original = game.update_game_state
+
+        def counting_update():
+            nonlocal calls
+            calls += 1
+            original()
+
+        game.update_game_state = counting_update
+        frames = game.advance(3000)
+        assert frames == 3000 or game.game_over
+        assert calls < frames // 5
+
+    def test_frames_to_next_event(self):
+        game = GameLogic(save_scores=False)
+        ball = Ball()
+        ball.x = game.paddle_x + 10
+        ball.y = game.paddle_y - BALL_RADIUS - 10
+        ball.speed = 3
+        game.balls = [ball]
+        # ceil(10 / 3) frames until the ball reaches the paddle
+        assert game.frames_to_next_event() == 4
+        ball.x = 10
+        assert game.frames_to_next_event() == (HEIGHT - ball.y) // 3 + 1
+
+
+class TestSnapshot:
+    @staticmethod
+    def _state(game):
+        return (
+            TestFastForward._state(game),
+            game.paddle_x,
+            [(b.speed, b.color) for b in game.balls],
+            [b.speed for b in game.bombs],
+        )
+
+    @staticmethod
+    def _play(game, frames, seed):
+        rng = random.Random(seed)
+        for _ in range(frames):
+            if rng.random() < 0.5:
+                game.move_paddle_left()
+            else:
+                game.move_paddle_right()
+            game.update_game_state()
+
+    def test_restore_branches_identically(self):
+        game = GameLogic(save_scores=False, seed=11)
+        game.lives = 100
+        self._play(game, 2000, 0)
+        snapshot = game.snapshot()
+        self._play(game, 3000, 1)
+        first = self._state(game)
+        game.restore(snapshot)
+        self._play(game, 3000, 1)
+        assert self._state(game) == first
+
+    def test_restore_into_another_game(self):
+        game = GameLogic(save_scores=False, seed=12)
+        self._play(game, 500, 2)
+        other = GameLogic(save_scores=False, seed=99)
+        other.restore(game.snapshot())
+        assert self._state(other) == self._state(game)
+        game.advance(2000)
+        other.advance(2000)
+        assert self._state(other) == self._state(game)
+
+    def test_snapshot_is_not_affected_by_play(self):
+        game = GameLogic(save_scores=False, seed=13)
+        snapshot = game.snapshot()
+        self._play(game, 1000, 3)
+        assert game.snapshot() != snapshot
+        game.restore(snapshot)
+        assert game.snapshot() == snapshot
+
+
+class TestEntityPool:
+    def test_entities_have_no_dict(self):
+        assert not hasattr(Ball(), "__dict__")
+        assert not hasattr(Bomb(), "__dict__")
+
+    def test_removed_entities_are_reused(self):
+        game = GameLogic(save_scores=False, seed=14)
+        game.lives = 1000
+        seen = set()
+        for _ in range(20000):
+            game.update_game_state()
+            seen.update(id(ball) for ball in game.balls)
+        spawned = 20000 // game.difficulty.ball_min_delay
+        # A handful of objects cycle through many spawns
+        assert len(seen) < spawned // 10
+
+    def test_recycled_ball_starts_at_top(self):
+        game = GameLogic(save_scores=False, seed=15)
+        old = game.balls[0]
+        old.y = HEIGHT + 100
+        game.ball_spawn_timer = game.ball_spawn_delay - 1
+        game.update_game_state()
+        assert game.balls == [old]
+        assert old.y == 0
+
+    def test_pooling_keeps_seeded_games_identical(self):
+        pooled = GameLogic(save_scores=False, seed=16)
+        fresh = GameLogic(save_scores=False, seed=16)
+        for _ in range(5000):
+            pooled.update_game_state()
+            fresh.update_game_state()
+            fresh._free_balls.clear()
+            fresh._free_bombs.clear()
+        assert TestSnapshot._state(pooled) == TestSnapshot._state(fresh)
+
+
+class TestBroadPhase:
+    def test_only_entities_near_paddle_are_tested(self):
+        game = GameLogic(save_scores=False)
+        game.balls = []
+        for y in range(-BALL_RADIUS, game.paddle_y - BALL_RADIUS - 10, 5):
+            ball = Ball()
+            ball.y = y
+            ball.speed = 3
+            game.balls.append(ball)
+        near = Ball()
+        near.y = game.paddle_y - BALL_RADIUS - 1
+        near.speed = 3
+        game.balls.append(near)
+        with patch.object(Ball, "is_caught", autospec=True, return_value=False) as caught:
+            game.update_game_state()
+        caught.assert_called_once()
+        assert caught.call_args[0][0] is near
+
+    def test_entities_in_band_are_tested_every_frame(self):
+        game = GameLogic(save_scores=False)
+        ball = Ball()
+        ball.x = 10
+        ball.y = game.paddle_y
+        ball.speed = 1
+        game.paddle_x = WIDTH - PADDLE_WIDTH
+        game.balls = [ball]
+        game.update_game_state()
+        assert game.balls[0] is ball
+        # The paddle reaching a ball that is already level with it counts
+        game.paddle_x = 0
+        game.update_game_state()
+        assert game.score == 1
+        assert ball not in game.balls
+
+
+class CountingList(list):
+    """List recording the calls that move or copy elements."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.calls = Counter()
+
+    def remove(self, value):
+        self.calls["remove"] += 1
+        super().remove(value)
+
+    def pop(self, *args):
+        self.calls["pop"] += 1
+        return super().pop(*args)
+
+    def insert(self, index, value):
+        self.calls["insert"] += 1
+        super().insert(index, value)
+
+    def copy(self):
+        self.calls["copy"] += 1
+        return super().copy()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            self.calls["slice"] += 1
+        return super().__getitem__(index)
+
+    def __setitem__(self, index, value):
+        self.calls["set"] += 1
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index):
+        self.calls["del"] += 1
+        super().__delitem__(index)
+
+
+class TestUpdateScaling:
+    def test_removal_is_linear(self):
+        # Removing one entity at a time (remove/pop/slicing) is quadratic;
+        # compaction writes each survivor once and truncates once
+        count = 1000
+        game = GameLogic(save_scores=False)
+        game.lives = count + 1
+        game.balls = CountingList(Ball() for _ in range(count))
+        game.bombs = CountingList(Bomb() for _ in range(count))
+        for i, entity in enumerate(game.balls + game.bombs):
+            # Every other entity leaves the screen this frame
+            entity.y = HEIGHT if i % 2 else 0
+        balls, bombs = game.balls, game.bombs
+        game.update_game_state()
+        for entities in (balls, bombs):
+            assert not {"remove", "pop", "insert", "copy", "slice"} & set(entities.calls)
+            assert entities.calls["del"] == 1
+            assert entities.calls["set"] <= count
+        assert len(balls) + len(bombs) <= count + 2
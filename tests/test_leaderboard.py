@@ -0,0 +1,134 @@
+# Add project root to sys.path to fix import issues
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import bisect
+import json
+import random
+import sqlite3
+from unittest.mock import Mock
+
+import pytest
+
+from src.game_classes import GameLogic
+from src.leaderboard import RANK, SQLiteLeaderboard
+
+
+@pytest.fixture
+def board(tmp_path):
+    return SQLiteLeaderboard(str(tmp_path / "scores.db"), check_interval=0)
+
+
+class TestSQLiteLeaderboard:
+    def test_keeps_every_result(self, board):
+        for score in range(25):
+            board.add(f"P{score % 5}", score)
+        assert board.flush(5)
+        assert board.count() == 25
+        assert [e["score"] for e in board.load()] == list(range(24, 14, -1))
+
+    def test_queries(self, board):
+        for name, score in [("Ann", 5), ("Bob", 9), ("Ann", 12), ("Cem", 9)]:
+            board.add(name, score)
+        assert board.flush(5)
+        assert board.top(2) == [{"name": "Ann", "score": 12}, {"name": "Bob", "score": 9}]
+        assert board.best_for("Ann") == 12
+        assert board.best_for("Nobody") is None
+        assert board.rank_of(12) == 1
+        assert board.rank_of(9) == 2
+        assert board.rank_of(6) == 4
+
+    def test_failed_write_is_retried(self, tmp_path):
+        board = SQLiteLeaderboard(str(tmp_path / "busy.db"), background=False)
+        board.add("Ann", 5)
+        board._write_conn = Mock()
+        board._write_conn.__enter__ = Mock(side_effect=sqlite3.OperationalError("locked"))
+        board.add("Bob", 7)
+        assert not board.flush()
+        assert board.count() == 1
+        assert board.load()[0] == {"name": "Bob", "score": 7}
+        board._write_conn = None
+        assert board.flush()
+        assert board.count() == 2
+
+    def test_wal_mode(self, board):
+        mode = board._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode.lower() == "wal"
+
+    def test_add_visible_before_write(self, board):
+        board.add("Ann", 7)
+        assert board.load()[0] == {"name": "Ann", "score": 7}
+
+    def test_sees_other_connections(self, tmp_path):
+        path = str(tmp_path / "shared.db")
+        reader = SQLiteLeaderboard(path, check_interval=0)
+        assert reader.load() == []
+        writer = SQLiteLeaderboard(path, background=False)
+        writer.add("Dan", 3)
+        assert reader.load() == [{"name": "Dan", "score": 3}]
+
+    def test_import_json(self, board, tmp_path):
+        path = tmp_path / "scores.json"
+        path.write_text(json.dumps([{"name": "Ann", "score": 4}, {"name": "Bob", "score": 2}]))
+        assert board.import_json(str(path)) == 2
+        assert board.load() == [{"name": "Ann", "score": 4}, {"name": "Bob", "score": 2}]
+
+    def test_queries_use_indexes(self, board):
+        conn = board._conn
+        for sql, args in [
+            ("SELECT name, score FROM results ORDER BY score DESC, id LIMIT 10", ()),
+            ("SELECT MAX(score) FROM results WHERE name = ?", ("Ann",)),
+        ]:
+            plan = " ".join(row[-1] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, args))
+            assert "INDEX" in plan, plan
+
+    def test_rank_does_not_scan_results(self, board):
+        plan = [row[-1] for row in board._conn.execute("EXPLAIN QUERY PLAN " + RANK, (5,))]
+        # Only primary key range searches on the two small count tables
+        tables = [step for step in plan if "score_" in step or "results" in step]
+        assert len(tables) == 2, plan
+        assert all(step.startswith("SEARCH score_") for step in tables), plan
+        assert all("PRIMARY KEY" in step for step in tables), plan
+
+    def test_rank_matches_count(self, board):
+        rng = random.Random(0)
+        rows = [(f"P{rng.randrange(500)}", rng.randrange(100000), 0.0) for _ in range(20000)]
+        with board._conn:
+            board._conn.executemany(
+                "INSERT INTO results (name, score, played_at) VALUES (?, ?, ?)", rows
+            )
+        scores = sorted(score for _, score, _ in rows)
+        for score in (-1, 0, 1023, 1024, 50000, 99999, 100000):
+            assert board.rank_of(score) == len(rows) - bisect.bisect_right(scores, score) + 1
+
+    def test_counts_existing_results(self, tmp_path):
+        # A database written before the rank counts were kept
+        path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE results (id INTEGER PRIMARY KEY, name TEXT NOT NULL,"
+            " score INTEGER NOT NULL, played_at REAL NOT NULL)"
+        )
+        conn.executemany(
+            "INSERT INTO results (name, score, played_at) VALUES ('Ann', ?, 0)",
+            [(score,) for score in (3, 3, 2000, 7)],
+        )
+        conn.commit()
+        conn.close()
+        board = SQLiteLeaderboard(path, background=False)
+        assert board.rank_of(3) == 3
+        board.add("Bob", 5)
+        assert board.rank_of(3) == 4
+        assert SQLiteLeaderboard(path).rank_of(3) == 4
+
+
+class TestGameLogicStore:
+    def test_game_uses_score_store(self, board, monkeypatch):
+        monkeypatch.setattr(GameLogic, "score_store", board)
+        game = GameLogic("Eve")
+        game.score = 8
+        game.save_score()
+        assert board.flush(5)
+        assert GameLogic.load_scores() == [{"name": "Eve", "score": 8}]
+        assert board.count() == 1
@@ -0,0 +1,91 @@
+# Add project root to sys.path to fix import issues
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import csv
+import json
+
+from src.profiler import DRAW, EVENTS, FLIP, TICK, UPDATE, FrameProfiler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def frame(profiler, clock, draw=0.004):
+    profiler.begin_frame()
+    for phase, seconds in ((EVENTS, 0.001), (UPDATE, 0.002), (DRAW, draw),
+                           (FLIP, 0.001), (TICK, 0.008)):
+        clock.now += seconds
+        profiler.mark(phase)
+    profiler.end_frame()
+
+
+class TestFrameProfiler:
+    def test_phase_times_and_percentiles(self):
+        clock = FakeClock()
+        profiler = FrameProfiler(budget=1 / 60, clock=clock)
+        for i in range(100):
+            # Every 20th frame has a slow draw
+            frame(profiler, clock, draw=0.030 if i % 20 == 0 else 0.004)
+        summary = profiler.summary()
+        assert summary["frames"] == 100
+        assert summary["dropped"] == 5
+        assert summary["update"]["p50"] == 2.0
+        assert summary["draw"]["p50"] == 4.0
+        assert summary["draw"]["p99"] == 30.0
+        assert summary["frame"]["p50"] == 16.0
+
+    def test_ring_buffer_keeps_latest_frames(self):
+        clock = FakeClock()
+        profiler = FrameProfiler(capacity=10, clock=clock)
+        for i in range(25):
+            frame(profiler, clock, draw=i / 1000)
+        rows = profiler.rows()
+        assert len(rows) == 10
+        assert [round(row[DRAW] * 1000) for row in rows] == list(range(15, 25))
+        assert profiler.frames == 25
+
+    def test_repeated_phase_accumulates(self):
+        clock = FakeClock()
+        profiler = FrameProfiler(clock=clock)
+        profiler.begin_frame()
+        clock.now += 0.001
+        profiler.mark(DRAW)
+        clock.now += 0.002
+        profiler.mark(FLIP)
+        clock.now += 0.003
+        profiler.mark(DRAW)
+        profiler.end_frame()
+        assert [round(t, 6) for t in profiler.rows()[0]] == [0, 0, 0.004, 0.002, 0, 0.006]
+
+    def test_dump_csv_and_jsonl(self, tmp_path):
+        clock = FakeClock()
+        profiler = FrameProfiler(clock=clock)
+        for _ in range(3):
+            frame(profiler, clock)
+        csv_path = str(tmp_path / "frames.csv")
+        profiler.dump(csv_path)
+        with open(csv_path) as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 3
+        assert float(rows[0]["draw"]) == 4.0
+
+        jsonl_path = str(tmp_path / "frames.jsonl")
+        profiler.dump(jsonl_path)
+        with open(jsonl_path) as f:
+            records = [json.loads(line) for line in f]
+        assert records[0]["frame"] == 16.0
+
+    def test_format_summary(self):
+        clock = FakeClock()
+        profiler = FrameProfiler(clock=clock)
+        frame(profiler, clock)
+        lines = profiler.format_summary()
+        assert lines[0] == "frames 1  dropped 0"
+        assert lines[-1].startswith("frame")
@@ -0,0 +1,182 @@
+# Add project root to sys.path to fix import issues
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from unittest.mock import MagicMock
+
+import pygame
+
+from src.game_classes import Ball, Bomb, GameLogic, HEIGHT, WIDTH, WHITE, RED
+from src.profiler import FrameProfiler
+from src.rendering import (
+    DirtyRectRenderer, ProfilerOverlay, SpriteCache, TextCache, draw_game
+)
+
+pygame.init()
+
+
+class TestTextCache:
+    def test_renders_once_per_key(self):
+        font = MagicMock()
+        cache = TextCache()
+        first = cache.render(font, "Score: 1", WHITE)
+        second = cache.render(font, "Score: 1", WHITE)
+        assert first is second
+        font.render.assert_called_once_with("Score: 1", True, WHITE)
+
+        cache.render(font, "Score: 1", RED)
+        cache.render(font, "Score: 2", WHITE)
+        assert font.render.call_count == 3
+
+    def test_lru_eviction(self):
+        font = MagicMock()
+        cache = TextCache(max_entries=2)
+        cache.render(font, "a", WHITE)
+        cache.render(font, "b", WHITE)
+        cache.render(font, "a", WHITE)  # "b" is now least recently used
+        cache.render(font, "c", WHITE)
+        assert len(cache) == 2
+        font.render.reset_mock()
+        cache.render(font, "a", WHITE)
+        font.render.assert_not_called()
+        cache.render(font, "b", WHITE)
+        font.render.assert_called_once()
+
+    def test_real_font(self):
+        font = pygame.font.Font(None, 36)
+        cache = TextCache()
+        surface = cache.render(font, "Lives: 3", RED)
+        assert surface.get_width() > 0
+        assert cache.render(font, "Lives: 3", RED) is surface
+
+
+class TestSpriteCache:
+    @staticmethod
+    def _pixels(surface):
+        return pygame.image.tostring(surface, "RGB")
+
+    def test_sprites_match_primitive_drawing(self):
+        game = GameLogic(save_scores=False, seed=4)
+        for _ in range(600):
+            game.update_game_state()
+        assert game.balls and game.bombs
+
+        expected = pygame.Surface((WIDTH, HEIGHT))
+        draw_game(expected, game)
+        actual = pygame.Surface((WIDTH, HEIGHT))
+        draw_game(actual, game, SpriteCache())
+        assert self._pixels(actual) == self._pixels(expected)
+
+    def test_sprites_are_reused(self):
+        sprites = SpriteCache()
+        assert sprites.ball(RED)[0] is sprites.ball(RED)[0]
+        assert sprites.ball(RED)[0] is not sprites.ball(WHITE)[0]
+        assert sprites.bomb()[0] is sprites.bomb()[0]
+
+    def test_blit_entities_single_call(self):
+        game = GameLogic(save_scores=False, seed=1)
+        screen = MagicMock()
+        SpriteCache().blit_entities(screen, game.balls, game.bombs)
+        screen.blits.assert_called_once()
+        assert len(screen.blits.call_args[0][0]) == len(game.balls) + len(game.bombs)
+
+
+class TestInterpolation:
+    @staticmethod
+    def _game():
+        game = GameLogic(save_scores=False, seed=3)
+        ball = Ball(game.rng)
+        ball.y = 200
+        bomb = Bomb(game.rng)
+        bomb.y = 300
+        game.balls.append(ball)
+        game.bombs.append(bomb)
+        return game
+
+    def test_full_lag_draws_previous_tick(self):
+        for sprites in (None, SpriteCache()):
+            game = self._game()
+            before = pygame.Surface((WIDTH, HEIGHT))
+            draw_game(before, game, sprites)
+            paddle_x = game.paddle_x
+            game.move_paddle_left()
+            game.update_game_state()
+            after = pygame.Surface((WIDTH, HEIGHT))
+            draw_game(after, game, sprites, lag=1.0, paddle_x=paddle_x)
+            assert pygame.image.tostring(after, "RGB") == pygame.image.tostring(
+                before, "RGB"
+            )
+
+    def test_partial_lag_moves_entities_part_way(self):
+        game = self._game()
+        screen = MagicMock()
+        SpriteCache().blit_entities(screen, game.balls, game.bombs, lag=0.5)
+        positions = [dest for _, dest in screen.blits.call_args[0][0]]
+        screen.reset_mock()
+        SpriteCache().blit_entities(screen, game.balls, game.bombs)
+        current = [dest for _, dest in screen.blits.call_args[0][0]]
+        entities = list(game.balls) + list(game.bombs)
+        for (x, y), (cx, cy), entity in zip(positions, current, entities):
+            assert x == cx
+            offset = entity.y - cy
+            assert y == round(entity.y - entity.speed * 0.5) - offset
+
+
+class TestDirtyRectRenderer:
+    def test_dirty_regions_reproduce_full_redraw(self):
+        font = pygame.font.Font(None, 36)
+        game = GameLogic(save_scores=False, seed=8)
+        sprites = SpriteCache()
+        back = pygame.Surface((WIDTH, HEIGHT))
+        shown = pygame.Surface((WIDTH, HEIGHT))
+        renderer = DirtyRectRenderer(back, sprites)
+        partial_frames = 0
+        for frame in range(400):
+            if frame % 50 < 25:
+                game.move_paddle_left()
+            else:
+                game.move_paddle_right()
+            game.update_game_state()
+            hud = [(font.render(f"Score: {game.score}", True, WHITE), (10, 10))]
+
+            dirty = renderer.draw_frame(game, hud)
+            # Emulate pygame.display.update by copying only dirty regions
+            if dirty is None:
+                shown.blit(back, (0, 0))
+            else:
+                partial_frames += 1
+                for rect in dirty:
+                    shown.blit(back, rect, rect)
+
+            expected = pygame.Surface((WIDTH, HEIGHT))
+            draw_game(expected, game, sprites)
+            for surface, position in hud:
+                expected.blit(surface, position)
+            assert pygame.image.tostring(shown, "RGB") == pygame.image.tostring(
+                expected, "RGB"
+            )
+        assert partial_frames > 300
+
+    def test_invalidate_forces_full_update(self):
+        game = GameLogic(save_scores=False, seed=2)
+        renderer = DirtyRectRenderer(pygame.Surface((WIDTH, HEIGHT)))
+        assert renderer.draw_frame(game, []) is None
+        assert renderer.draw_frame(game, []) is not None
+        renderer.invalidate()
+        assert renderer.draw_frame(game, []) is None
+
+
+class TestProfilerOverlay:
+    def test_rerenders_once_per_interval(self):
+        profiler = FrameProfiler()
+        font = MagicMock()
+        font.get_linesize.return_value = 20
+        overlay = ProfilerOverlay(profiler, font, position=(5, 40), interval=60)
+        first = overlay.surfaces()
+        assert len(first) == len(profiler.format_summary())
+        assert first[1][1] == (5, 60)
+        calls = font.render.call_count
+        assert overlay.surfaces() is first
+        assert font.render.call_count == calls
@@ -0,0 +1,137 @@
+# Add project root to sys.path to fix import issues
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import random
+
+import pytest
+
+from src.game_classes import Difficulty, GameLogic
+from src.replay import (
+    LEFT, RESTART, RIGHT, Recorder, Replay, ReplayError, add_keyframes,
+    encode_state, play, restore_state, seek
+)
+
+
+def play_session(seed, frames, restarts=1, difficulty=Difficulty()):
+    """Drive a game the way main() does, recording it; return game and replay."""
+    rng = random.Random(seed)
+    game = GameLogic("Tester", save_scores=False, seed=seed, difficulty=difficulty)
+    recorder = Recorder(game)
+    left = right = False
+    played = 0
+    while played < frames:
+        if game.game_over:
+            if not restarts:
+                break
+            restarts -= 1
+            game.reset_game()
+            recorder.restart()
+        if rng.random() < 0.05:
+            left, right = rng.choice([(True, False), (False, True), (False, False), (True, True)])
+        recorder.record(left, right)
+        if left:
+            game.move_paddle_left()
+        if right:
+            game.move_paddle_right()
+        game.update_game_state()
+        played += 1
+    return game, recorder.finish()
+
+
+class TestReplay:
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_playback_matches_session(self, seed):
+        game, replay = play_session(seed, 20000)
+        replayed = play(Replay.decode(replay.encode()))
+        assert (replayed.score, replayed.lives, replayed.game_over) == (
+            game.score, game.lives, game.game_over
+        )
+        assert replayed.paddle_x == game.paddle_x
+        assert [(b.x, b.y) for b in replayed.balls] == [(b.x, b.y) for b in game.balls]
+
+    def test_restart_is_recorded(self):
+        game, replay = play_session(5, 50000, restarts=2)
+        assert sum(1 for bits, _ in replay.runs if bits & RESTART) >= 1
+        assert play(replay).score == game.score
+
+    def test_roundtrip(self, tmp_path):
+        replay = Replay(
+            123456789, "Zoë", Difficulty(ball_delay=40),
+            [(0, 5), (LEFT, 300), (RIGHT, 1), (LEFT | RESTART, 1), (0, 100000)],
+        )
+        path = str(tmp_path / "session.ctbr")
+        replay.save(path)
+        loaded = Replay.load(path)
+        assert loaded.seed == replay.seed
+        assert loaded.player_name == "Zoë"
+        assert loaded.difficulty == replay.difficulty
+        assert loaded.runs == replay.runs
+        assert loaded.frames == 100307
+
+    def test_run_length_encoding_is_compact(self):
+        recorder = Recorder(GameLogic(save_scores=False, seed=1))
+        for frame in range(60 * 60 * 10):  # ten minutes
+            recorder.record(frame % 600 < 300, False)
+        data = recorder.finish().encode()
+        # 120 runs of 300 frames: about 3 bytes per run plus the header
+        assert len(data) < 450
+
+    def test_corrupt_data(self):
+        data = Replay(1, runs=[(LEFT, 1000)]).encode()
+        with pytest.raises(ReplayError):
+            Replay.decode(data[:-1])
+        with pytest.raises(ReplayError):
+            Replay.decode(b"XXXX" + data[4:])
+
+
+def game_state(game):
+    return (
+        game.paddle_x, game.score, game.lives, game.game_over,
+        game.ball_spawn_timer, game.bomb_spawn_timer,
+        game.ball_spawn_delay, game.bomb_spawn_delay,
+        [(b.x, b.y, b.speed, b.color) for b in game.balls],
+        [(b.x, b.y, b.speed) for b in game.bombs],
+    )
+
+
+class TestKeyframes:
+    def test_restored_state_plays_on_identically(self):
+        game, _ = play_session(4, 3000, restarts=0)
+        copy = GameLogic("Tester", save_scores=False, seed=99)
+        restore_state(copy, encode_state(game))
+        assert game_state(copy) == game_state(game)
+        for _ in range(5000):
+            game.update_game_state()
+            copy.update_game_state()
+        assert game_state(copy) == game_state(game)
+
+    @pytest.mark.parametrize("seed", [6, 7])
+    def test_seek_matches_playing_from_start(self, seed):
+        _, replay = play_session(seed, 30000, restarts=2)
+        add_keyframes(replay, interval=1000)
+        assert len(replay.keyframes) == replay.frames // 1000
+        plain = Replay(replay.seed, replay.player_name, replay.difficulty, replay.runs)
+        rng = random.Random(seed)
+        frames = [0, 999, 1000, 1001, replay.frames]
+        frames += [rng.randrange(replay.frames + 1) for _ in range(10)]
+        for frame in frames:
+            assert game_state(seek(replay, frame)) == game_state(seek(plain, frame))
+        assert game_state(seek(replay, replay.frames)) == game_state(play(replay))
+
+    def test_keyframes_survive_roundtrip(self, tmp_path):
+        _, replay = play_session(8, 10000)
+        add_keyframes(replay, interval=2500)
+        path = str(tmp_path / "session.ctbr")
+        replay.save(path)
+        loaded = Replay.load(path)
+        assert loaded.keyframe_interval == 2500
+        assert loaded.keyframes == replay.keyframes
+        frame = replay.frames * 3 // 4
+        assert game_state(seek(loaded, frame)) == game_state(seek(replay, frame))
+
+    def test_seek_outside_replay(self):
+        replay = Replay(1, runs=[(0, 10)])
+        with pytest.raises(ValueError):
+            seek(replay, 11)
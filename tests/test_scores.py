@@ -0,0 +1,240 @@
+# Add project root to sys.path to fix import issues
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+import subprocess
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.game_classes import GameLogic
+from src.scores import (
+    FileLock, ScoreBoard, ScoreWriter, flush_all, get_scoreboard,
+    write_json_atomic
+)
+
+
+@pytest.fixture
+def scores_file(tmp_path):
+    return str(tmp_path / "scores.json")
+
+
+class TestScoreBoard:
+    def test_missing_file_is_created(self, scores_file):
+        board = ScoreBoard(scores_file)
+        assert board.load() == []
+        with open(scores_file) as f:
+            assert json.load(f) == []
+
+    def test_creating_file_keeps_concurrent_write(self, scores_file):
+        other = [{"name": "Bob", "score": 12}]
+
+        class RacingLock(FileLock):
+            def __enter__(self):
+                # Another process writes its score just before we lock
+                write_json_atomic(scores_file, other)
+                return super().__enter__()
+
+        with patch("src.scores.FileLock", RacingLock):
+            assert ScoreBoard(scores_file).load() == other
+
+    def test_repeated_loads_do_not_reopen_file(self, scores_file):
+        board = ScoreBoard(scores_file, check_interval=0)
+        board.add("Ann", 5)
+        assert board.flush(5)
+        with patch("builtins.open") as mock_open:
+            for _ in range(100):
+                assert board.load() == [{"name": "Ann", "score": 5}]
+            mock_open.assert_not_called()
+
+    def test_outside_changes_are_picked_up(self, scores_file):
+        board = ScoreBoard(scores_file, check_interval=0)
+        board.add("Ann", 5)
+        assert board.flush(5)
+        with open(scores_file, "w") as f:
+            json.dump([{"name": "Bob", "score": 12}, {"name": "Ann", "score": 5}], f)
+        assert board.load()[0] == {"name": "Bob", "score": 12}
+
+    def test_replaced_while_reading_is_read_again(self, scores_file):
+        write_json_atomic(scores_file, [{"name": "Ann", "score": 5}])
+        board = ScoreBoard(scores_file, check_interval=0)
+        newer = [{"name": "Bob", "score": 12}, {"name": "Ann", "score": 5}]
+        read_file = board._read_file
+
+        def read_then_replace():
+            entries = read_file()
+            write_json_atomic(scores_file, newer)
+            return entries
+
+        with patch.object(board, "_read_file", read_then_replace):
+            assert board.load() == [{"name": "Ann", "score": 5}]
+        assert board.load() == newer
+
+    def test_check_interval_throttles_stat(self, scores_file):
+        board = ScoreBoard(scores_file, check_interval=60)
+        board.load()
+        with patch("os.stat") as mock_stat:
+            board.load()
+            mock_stat.assert_not_called()
+
+    def test_add_keeps_top_entries(self, scores_file):
+        board = ScoreBoard(scores_file, limit=3)
+        for score in (4, 9, 1, 7):
+            board.add(f"P{score}", score)
+        assert [entry["score"] for entry in board.load()] == [9, 7, 4]
+        assert board.flush(5)
+        with open(scores_file) as f:
+            assert [entry["score"] for entry in json.load(f)] == [9, 7, 4]
+
+    def test_load_returns_copy(self, scores_file):
+        board = ScoreBoard(scores_file)
+        board.add("Ann", 5)
+        board.load().append({"name": "X", "score": 99})
+        assert len(board.load()) == 1
+
+
+class TestBackgroundWrites:
+    def test_add_does_not_wait_for_disk(self, scores_file):
+        board = ScoreBoard(scores_file)
+        release = threading.Event()
+        real_write = board._write_pending
+
+        def slow_write():
+            release.wait(5)
+            real_write()
+
+        board._writer = ScoreWriter(slow_write)
+        board.add("Ann", 5)
+        # Visible in memory at once, on disk only after the writer runs
+        assert board.load() == [{"name": "Ann", "score": 5}]
+        assert not board.flush(0.05)
+        release.set()
+        assert board.flush(5)
+        with open(scores_file) as f:
+            assert json.load(f) == [{"name": "Ann", "score": 5}]
+
+    def test_bursts_are_coalesced(self, scores_file):
+        board = ScoreBoard(scores_file, limit=100)
+        writes = []
+        real_write = board._write_pending
+        started = threading.Event()
+        release = threading.Event()
+
+        def gated_write():
+            writes.append(len(board._pending))
+            started.set()
+            release.wait(5)
+            real_write()
+
+        board._writer = ScoreWriter(gated_write)
+        board.add("first", 0)
+        assert started.wait(5)
+        for i in range(1, 50):
+            board.add(f"P{i}", i)
+        release.set()
+        assert board.flush(5)
+        # One write for the first score, one for the whole burst after it
+        assert len(writes) == 2
+        with open(scores_file) as f:
+            assert len(json.load(f)) == 50
+
+    def test_failed_write_is_retried(self, scores_file):
+        board = ScoreBoard(scores_file, background=False)
+        board.load()
+        with patch("src.scores.write_json_atomic", side_effect=PermissionError):
+            board.add("Ann", 5)
+            assert not board.flush()
+        assert board.load() == [{"name": "Ann", "score": 5}]
+        board.add("Bob", 7)
+        with open(scores_file) as f:
+            assert json.load(f) == [{"name": "Bob", "score": 7}, {"name": "Ann", "score": 5}]
+
+    def test_flush_retries_failed_write(self, scores_file):
+        board = ScoreBoard(scores_file)
+        with patch("src.scores.write_json_atomic", side_effect=PermissionError):
+            board.add("Ann", 5)
+            board._writer.flush(5)
+        assert board.flush(5)
+        with open(scores_file) as f:
+            assert json.load(f) == [{"name": "Ann", "score": 5}]
+
+    def test_atomic_write_leaves_no_temp_files(self, scores_file, tmp_path):
+        write_json_atomic(scores_file, [{"name": "Ann", "score": 1}])
+        assert os.listdir(tmp_path) == ["scores.json"]
+
+    def test_flush_all(self, scores_file):
+        board = get_scoreboard(scores_file)
+        board.add("Ann", 3)
+        flush_all()
+        with open(scores_file) as f:
+            assert json.load(f) == [{"name": "Ann", "score": 3}]
+
+
+WRITER_SCRIPT = """
+import sys
+sys.path.insert(0, {root!r})
+from src.scores import ScoreBoard
+board = ScoreBoard({path!r}, limit=100000)
+for i in range({count}):
+    board.add("w{{}}-{{}}".format(sys.argv[1], i), i)
+assert board.flush(30)
+"""
+
+
+class TestSharedFile:
+    def test_concurrent_writer_processes_lose_nothing(self, scores_file):
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        writers, count = 12, 20
+        script = WRITER_SCRIPT.format(root=root, path=scores_file, count=count)
+        procs = [
+            subprocess.Popen([sys.executable, "-c", script, str(w)])
+            for w in range(writers)
+        ]
+        # Read concurrently: the file must always be complete JSON
+        while any(p.poll() is None for p in procs):
+            if os.path.exists(scores_file):
+                with open(scores_file) as f:
+                    json.load(f)
+        assert all(p.returncode == 0 for p in procs)
+
+        with open(scores_file) as f:
+            names = [entry["name"] for entry in json.load(f)]
+        assert len(names) == writers * count
+        assert set(names) == {f"w{w}-{i}" for w in range(writers) for i in range(count)}
+
+    def test_merge_keeps_other_writers_entries(self, scores_file):
+        first = ScoreBoard(scores_file, background=False)
+        second = ScoreBoard(scores_file, background=False)
+        first.load()
+        second.load()
+        first.add("Ann", 5)
+        second.add("Bob", 7)
+        with open(scores_file) as f:
+            assert json.load(f) == [{"name": "Bob", "score": 7}, {"name": "Ann", "score": 5}]
+
+    def test_write_right_after_unlock_is_noticed(self, scores_file):
+        board = ScoreBoard(scores_file, check_interval=0, background=False)
+        other = [{"name": "Bob", "score": 12}, {"name": "Ann", "score": 5}]
+
+        class RacingLock(FileLock):
+            def __exit__(self, *exc_info):
+                super().__exit__(*exc_info)
+                # Another process writes as soon as the lock is free
+                write_json_atomic(scores_file, other)
+
+        with patch("src.scores.FileLock", RacingLock):
+            board.add("Ann", 5)
+        assert board.load() == other
+
+
+class TestGameLogicScores:
+    def test_save_and_load_through_scoreboard(self, scores_file, monkeypatch):
+        monkeypatch.setattr("src.game_classes.SCORES_FILE", scores_file)
+        game = GameLogic("Cem")
+        game.score = 42
+        game.save_score()
+        assert GameLogic.load_scores() == [{"name": "Cem", "score": 42}]
+        assert get_scoreboard(scores_file).load() == GameLogic.load_scores()
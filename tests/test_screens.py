@@ -0,0 +1,104 @@
+# Add project root to sys.path to fix import issues
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import importlib
+
+import pygame
+import pytest
+
+from src.game_classes import GameLogic
+
+main = importlib.import_module("src.main")
+
+
+@pytest.fixture
+def screen(monkeypatch):
+    main.init_display()
+    pygame.event.clear()
+    flips = []
+    monkeypatch.setattr(pygame.display, "flip", lambda: flips.append(1))
+    monkeypatch.setattr(main, "IDLE_TIMEOUT_MS", 5)
+    monkeypatch.setattr(GameLogic, "load_scores", staticmethod(lambda: []))
+    return flips
+
+
+def key(k, unicode=""):
+    return pygame.event.Event(pygame.KEYDOWN, key=k, unicode=unicode)
+
+
+def script_waits(monkeypatch, actions):
+    """Run actions[n](timeout) before the n-th event wait; record timeouts."""
+    timeouts = []
+    real_wait = pygame.event.wait
+
+    def wait(timeout):
+        timeouts.append(timeout)
+        action = actions.get(len(timeouts))
+        if action is not None:
+            action()
+        return real_wait(timeout)
+
+    monkeypatch.setattr(pygame.event, "wait", wait)
+    return timeouts
+
+
+class TestNameEntry:
+    def test_typed_name_is_returned(self, screen):
+        for k, char in ((pygame.K_b, "B"), (pygame.K_o, "o"), (pygame.K_x, "x")):
+            pygame.event.post(key(k, char))
+        pygame.event.post(key(pygame.K_BACKSPACE))
+        pygame.event.post(key(pygame.K_b, "b"))
+        pygame.event.post(key(pygame.K_RETURN))
+        assert main.get_player_name() == "Bob"
+        # Queued keys are handled as one batch: no frame per key
+        assert len(screen) == 1
+
+    def test_idle_screen_is_not_redrawn(self, screen, monkeypatch):
+        script_waits(monkeypatch, {
+            10: lambda: pygame.event.post(key(pygame.K_a, "a")),
+            20: lambda: pygame.event.post(key(pygame.K_RETURN)),
+        })
+        assert main.get_player_name() == "a"
+        # The first frame, then one after the single key press
+        assert len(screen) == 2
+
+
+class TestGameOverScreen:
+    def test_space_restarts_without_redrawing_while_idle(self, screen, monkeypatch):
+        timeouts = script_waits(monkeypatch, {
+            8: lambda: pygame.event.post(key(pygame.K_SPACE)),
+        })
+        assert main.show_game_over(GameLogic(save_scores=False)) is True
+        assert len(timeouts) == 8
+        assert len(screen) == 1
+
+    def test_quit(self, screen):
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        assert main.show_game_over(GameLogic(save_scores=False)) is False
+
+    def test_new_high_scores_are_shown(self, screen, monkeypatch):
+        boards = iter([[], [], [{"name": "Ann", "score": 3}]])
+        monkeypatch.setattr(
+            GameLogic, "load_scores",
+            staticmethod(lambda: next(boards, [{"name": "Ann", "score": 3}])),
+        )
+        script_waits(monkeypatch, {
+            6: lambda: pygame.event.post(key(pygame.K_SPACE)),
+        })
+        assert main.show_game_over(GameLogic(save_scores=False)) is True
+        assert len(screen) == 2
+
+    def test_waits_longer_without_focus(self, screen, monkeypatch):
+        pygame.event.post(pygame.event.Event(pygame.WINDOWFOCUSLOST))
+        timeouts = script_waits(monkeypatch, {
+            3: lambda: pygame.event.post(pygame.event.Event(pygame.WINDOWFOCUSGAINED)),
+            4: lambda: pygame.event.post(key(pygame.K_SPACE)),
+        })
+        monkeypatch.setattr(main, "UNFOCUSED_TIMEOUT_MS", 50)
+        assert main.show_game_over(GameLogic(save_scores=False)) is True
+        assert timeouts[:3] == [5, 50, 50]
+        # Regaining focus redraws in case the window was covered
+        assert len(screen) == 2
@@ -0,0 +1,56 @@
+# Add project root to sys.path to fix import issues
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import subprocess
+
+from src.game_classes import GameLogic, PADDLE_WIDTH, WIDTH
+from src.simulation import (
+    LEFT, RIGHT, STAY, apply_action, follow_lowest_ball, run_headless, stationary
+)
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+class TestHeadless:
+    def test_logic_imports_without_pygame(self):
+        code = (
+            "import sys; import src.game_classes, src.simulation, "
+            "src.replay, src.verify, src.tuning; "
+            "sys.exit('pygame' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT)
+        assert result.returncode == 0
+
+    def test_run_headless_until_game_over(self):
+        game = GameLogic(save_scores=False)
+        frames = run_headless(game, follow_lowest_ball, max_frames=100000)
+        assert game.game_over
+        assert game.lives == 0
+        assert frames < 100000
+
+    def test_run_headless_frame_limit(self):
+        game = GameLogic(save_scores=False)
+        frames = run_headless(game, stationary, max_frames=10)
+        assert frames == 10
+        assert game.ball_spawn_timer == 10
+
+    def test_apply_action(self):
+        game = GameLogic(save_scores=False)
+        start = game.paddle_x
+        apply_action(game, LEFT)
+        assert game.paddle_x == start - game.paddle_speed
+        apply_action(game, STAY)
+        assert game.paddle_x == start - game.paddle_speed
+        apply_action(game, RIGHT)
+        apply_action(game, RIGHT)
+        assert game.paddle_x == start + game.paddle_speed
+        assert 0 <= game.paddle_x <= WIDTH - PADDLE_WIDTH
+
+    def test_save_scores_disabled(self, tmp_path, monkeypatch):
+        scores_file = tmp_path / "scores.json"
+        monkeypatch.setattr("src.game_classes.SCORES_FILE", str(scores_file))
+        game = GameLogic(save_scores=False)
+        game.save_score()
+        assert not scores_file.exists()
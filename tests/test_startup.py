@@ -0,0 +1,49 @@
+# Add project root to sys.path to fix import issues
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import subprocess
+
+from src.benchmark import import_time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def run_python(code):
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys; sys.path.insert(0, {ROOT!r})\n" + code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        env=env,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+class TestStartup:
+    def test_importing_main_has_no_side_effects(self):
+        code = "import src.main, pygame\n"
+        code += "print(pygame.display.get_init(), pygame.font.get_init(), src.main.screen)"
+        assert run_python(code) == "False False None\n"
+
+    def test_imports_leave_environment_alone(self):
+        code = "import os\n"
+        code += "for name in ('SDL_VIDEODRIVER', 'PYGAME_HIDE_SUPPORT_PROMPT'):\n"
+        code += "    os.environ.pop(name)\n"
+        code += "before = dict(os.environ)\n"
+        code += "import src.main, src.benchmark\n"
+        code += "print(dict(os.environ) == before)"
+        # pygame's banner is printed now that it is not hidden
+        assert run_python(code).endswith("True\n")
+
+    def test_init_display_is_lazy_and_idempotent(self):
+        code = "import src.main as m, pygame\n"
+        code += "m.init_display(); screen = m.screen; m.init_display()\n"
+        code += "print(pygame.display.get_init(), m.screen is screen, pygame.mixer.get_init())"
+        assert run_python(code) == "True True None\n"
+
+    def test_import_time_measurement(self):
+        assert 0 < import_time("src.game_classes") < 5
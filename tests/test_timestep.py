@@ -0,0 +1,65 @@
+# Add project root to sys.path to fix import issues
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+from src.timestep import FixedTimestep
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def run(timestep, clock, frame_time, seconds):
+    ticks = 0
+    for _ in range(round(seconds / frame_time)):
+        clock.now += frame_time
+        ticks += timestep.ticks()
+    return ticks
+
+
+class TestFixedTimestep:
+    @pytest.mark.parametrize("render_rate", [30, 60, 144, 240])
+    def test_tick_rate_does_not_depend_on_render_rate(self, render_rate):
+        clock = FakeClock()
+        timestep = FixedTimestep(60, clock=clock)
+        ticks = run(timestep, clock, 1 / render_rate, 10)
+        assert abs(ticks - 600) <= 1
+
+    def test_fast_rendering_interpolates(self):
+        clock = FakeClock()
+        timestep = FixedTimestep(60, clock=clock)
+        clock.now += 1 / 240
+        assert timestep.ticks() == 0
+        assert timestep.alpha == pytest.approx(0.25)
+        clock.now += 1 / 240
+        assert timestep.ticks() == 0
+        assert timestep.alpha == pytest.approx(0.5)
+
+    def test_slow_rendering_runs_several_ticks(self):
+        clock = FakeClock()
+        timestep = FixedTimestep(60, clock=clock)
+        clock.now += 1 / 20 + 1e-9
+        assert timestep.ticks() == 3
+
+    def test_long_stall_is_capped(self):
+        clock = FakeClock()
+        timestep = FixedTimestep(60, max_ticks=5, clock=clock)
+        clock.now += 10
+        assert timestep.ticks() == 5
+        assert timestep.accumulator == 0
+
+    def test_reset_forgets_elapsed_time(self):
+        clock = FakeClock()
+        timestep = FixedTimestep(60, clock=clock)
+        clock.now += 0.5
+        timestep.reset()
+        clock.now += 1 / 120
+        assert timestep.ticks() == 0
+        assert timestep.alpha == pytest.approx(0.5)
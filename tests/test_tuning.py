@@ -0,0 +1,66 @@
+# Add project root to sys.path to fix import issues
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+from src.game_classes import DEFAULT_DIFFICULTY, Difficulty, GameLogic
+from src import tuning
+
+
+class TestDifficulty:
+    def test_default_curves_match_original_rules(self):
+        for score in range(0, 400):
+            assert DEFAULT_DIFFICULTY.ball_spawn_delay(score) == max(15, 60 - (score // 5) * 5)
+            assert DEFAULT_DIFFICULTY.bomb_spawn_delay(score) == max(60, 180 - (score // 10) * 15)
+
+    def test_game_uses_difficulty(self):
+        difficulty = Difficulty(ball_delay=30, bomb_delay=90)
+        game = GameLogic(save_scores=False, difficulty=difficulty)
+        assert game.ball_spawn_delay == 30
+        assert game.bomb_spawn_delay == 90
+        game.score = 5
+        game.ball_spawn_timer = 29
+        game.update_game_state()
+        assert game.ball_spawn_delay == 25
+
+
+class TestTuner:
+    def test_parse_candidate(self):
+        difficulty = tuning.parse_candidate("ball_min_delay=20, bomb_delay=150")
+        assert difficulty.ball_min_delay == 20
+        assert difficulty.bomb_delay == 150
+        assert difficulty.ball_delay == DEFAULT_DIFFICULTY.ball_delay
+        with pytest.raises(ValueError):
+            tuning.parse_candidate("speed=3")
+
+    def test_evaluate_is_cached_per_seed(self, tmp_path, monkeypatch):
+        cache_file = str(tmp_path / "cache.json")
+        candidates = [DEFAULT_DIFFICULTY, Difficulty(bomb_min_delay=30)]
+        first = tuning.evaluate(
+            candidates, range(6), max_frames=1200, workers=2,
+            cache=tuning.ResultCache(cache_file),
+        )
+        assert first[DEFAULT_DIFFICULTY].games == 6
+        assert first[DEFAULT_DIFFICULTY] == tuning.summarize(
+            [tuning.play_game(DEFAULT_DIFFICULTY, seed, "follow", 1200) for seed in range(6)],
+            1200,
+        )
+
+        # Everything is cached now, so no pool should be started
+        def no_pool(*args, **kwargs):
+            raise AssertionError("pool started for cached results")
+
+        monkeypatch.setattr(tuning, "ProcessPoolExecutor", no_pool)
+        again = tuning.evaluate(
+            candidates, range(6), max_frames=1200, cache=tuning.ResultCache(cache_file)
+        )
+        assert again == first
+
+    def test_summary(self):
+        summary = tuning.summarize([(1, 60), (2, 120), (3, 600)], max_frames=600)
+        assert summary.games == 3
+        assert summary.mean_score == 2
+        assert summary.score_percentiles == (1, 2, 3)
+        assert summary.survived_cap == pytest.approx(1 / 3)
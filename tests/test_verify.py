@@ -0,0 +1,98 @@
+# Add project root to sys.path to fix import issues
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+
+from src.game_classes import Difficulty
+from src.replay import Replay
+from src.scores import ScoreBoard
+from src.verify import Submission, check, main, verify
+
+from test_replay import play_session
+
+
+def honest(seed, frames=20000):
+    game, replay = play_session(seed, frames, restarts=0)
+    return Submission(replay.encode(), game.score, game.lives)
+
+
+class TestVerify:
+    def test_honest_submission_is_accepted(self):
+        submission = honest(1)
+        verdict = check(submission)
+        assert verdict.accepted
+        assert verdict.score == submission.score
+        assert verdict.player_name == "Tester"
+
+    def test_inflated_score_is_rejected(self):
+        submission = honest(2)
+        verdict = check(submission._replace(score=submission.score + 1))
+        assert not verdict.accepted
+        assert verdict.score == submission.score
+
+    def test_wrong_lives_are_rejected(self):
+        submission = honest(3)
+        assert not check(submission._replace(lives=submission.lives + 1)).accepted
+
+    def test_corrupt_replay_is_rejected(self):
+        submission = honest(4)
+        verdict = check(submission._replace(replay=submission.replay[:-3]))
+        assert not verdict.accepted
+        assert verdict.reason
+
+    def test_overlong_replay_is_rejected(self):
+        assert not check(honest(5), max_frames=10).accepted
+
+    def test_tampered_difficulty_is_rejected(self):
+        easy = Difficulty(
+            ball_delay=1, ball_min_delay=1, bomb_delay=10 ** 9, bomb_min_delay=10 ** 9
+        )
+        replay = Replay(1, "Cheater", easy, [(0, 300)])
+        # The claim itself is truthful for the curves in the replay
+        played = check(Submission(replay.encode(), 0), difficulties=(easy,))
+        assert played.score > 0
+        submission = Submission(replay.encode(), played.score, played.lives)
+        assert check(submission, difficulties=(easy,)).accepted
+        verdict = check(submission)
+        assert not verdict.accepted
+        assert verdict.reason == "non-standard difficulty"
+
+    def test_failing_replay_does_not_abort_batch(self):
+        poisoned = Difficulty(ball_score_step=0)
+        replay = Replay(1, "Cheater", poisoned, [(0, 300)])
+        submissions = [Submission(replay.encode(), 10), honest(9, 5000)]
+        verdicts = verify(submissions, workers=2, difficulties=(Difficulty(), poisoned))
+        assert [v.accepted for v in verdicts] == [False, True]
+        assert "ZeroDivisionError" in verdicts[0].reason
+
+    def test_pool_keeps_submission_order(self):
+        submissions = [honest(seed, 5000) for seed in range(6)]
+        submissions[2] = submissions[2]._replace(score=submissions[2].score + 10)
+        verdicts = verify(submissions, workers=2)
+        assert [v.accepted for v in verdicts] == [True, True, False, True, True, True]
+        assert verdicts == verify(submissions, workers=1)
+
+
+class TestCommandLine:
+    def test_accepted_scores_are_written(self, tmp_path, capsys):
+        claims = []
+        for seed, bonus in ((6, 0), (7, 5)):
+            submission = honest(seed, 5000)
+            name = f"s{seed}.ctbr"
+            (tmp_path / name).write_bytes(submission.replay)
+            claims.append({
+                "replay": name,
+                "score": submission.score + bonus,
+                "lives": submission.lives,
+            })
+        claims_file = tmp_path / "claims.json"
+        claims_file.write_text(json.dumps(claims))
+        scores_file = str(tmp_path / "scores.json")
+
+        main([str(claims_file), "--scores", scores_file, "--workers", "1"])
+        assert "1 of 2 accepted" in capsys.readouterr().out
+        assert ScoreBoard(scores_file).load() == [
+            {"name": "Tester", "score": claims[0]["score"]}
+        ]